@@ -0,0 +1,27 @@
+"""add server-side uuid default to model.id
+
+Revision ID: q2r3s4t5u6v7
+Revises: 20251230_073000
+Create Date: 2026-01-05 10:00:00.000000
+
+Model ids are generated by Postgres (gen_random_uuid(), built in since PG13)
+instead of uuid.uuid4() in Python, so bulk seeding no longer creates UUIDs
+client-side.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'q2r3s4t5u6v7'
+down_revision = '20251230_073000'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column('model', 'id', server_default=sa.text('gen_random_uuid()'))
+
+
+def downgrade() -> None:
+    op.alter_column('model', 'id', server_default=None)
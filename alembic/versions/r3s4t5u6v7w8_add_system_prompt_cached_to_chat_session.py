@@ -0,0 +1,25 @@
+"""Add system_prompt_cached column to chat_session table
+
+Revision ID: r3s4t5u6v7w8
+Revises: q2r3s4t5u6v7
+Create Date: 2026-01-06 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'r3s4t5u6v7w8'
+down_revision = 'q2r3s4t5u6v7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Rendered system prompt, filled on the first message of each session
+    op.add_column('chat_session', sa.Column('system_prompt_cached', sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('chat_session', 'system_prompt_cached')
@@ -0,0 +1,88 @@
+"""Create append-only chat_message table
+
+Revision ID: s4t5u6v7w8x9
+Revises: r3s4t5u6v7w8
+Create Date: 2026-01-07 09:00:00.000000
+
+Messages were stored as JSONB arrays on chat_session (messages and
+interaction_messages), rewritten in full on every exchange. They now live
+one row per message in chat_message. Existing sessions are backfilled from
+the legacy messages column, and total_messages is realigned with the row
+count (it doubles as the next seq).
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 's4t5u6v7w8x9'
+down_revision = 'r3s4t5u6v7w8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'chat_message',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('session_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('seq', sa.Integer(), nullable=False),
+        sa.Column('role', sa.String(length=20), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('sources', postgresql.JSONB(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['session_id'], ['chat_session.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_chat_message_session_seq', 'chat_message', ['session_id', 'seq'], unique=True)
+
+    # Backfill from the legacy messages column
+    op.execute("""
+        INSERT INTO chat_message (id, session_id, seq, role, content, sources, created_at)
+        SELECT
+            gen_random_uuid(),
+            s.id,
+            m.ordinality - 1,
+            m.value->>'role',
+            COALESCE(m.value->>'content', ''),
+            CASE WHEN jsonb_typeof(m.value->'sources') = 'array' THEN m.value->'sources' END,
+            COALESCE((m.value->>'created_at')::timestamptz, s.started_at, now())
+        FROM chat_session s
+        CROSS JOIN LATERAL jsonb_array_elements(s.messages) WITH ORDINALITY AS m(value, ordinality)
+        WHERE jsonb_typeof(s.messages) = 'array'
+    """)
+    op.execute("""
+        UPDATE chat_session
+        SET total_messages = CASE
+            WHEN jsonb_typeof(messages) = 'array' THEN jsonb_array_length(messages)
+            ELSE 0
+        END
+    """)
+
+
+def downgrade() -> None:
+    # Rebuild the JSONB columns from chat_message before dropping it
+    op.execute("""
+        UPDATE chat_session s
+        SET messages = agg.msgs,
+            interaction_messages = agg.interaction
+        FROM (
+            SELECT
+                session_id,
+                jsonb_agg(
+                    jsonb_strip_nulls(jsonb_build_object(
+                        'role', role,
+                        'content', content,
+                        'created_at', created_at,
+                        'sources', sources
+                    )) ORDER BY seq
+                ) AS msgs,
+                jsonb_agg(jsonb_build_object('role', role, 'content', content) ORDER BY seq) AS interaction
+            FROM chat_message
+            GROUP BY session_id
+        ) agg
+        WHERE s.id = agg.session_id
+    """)
+    op.drop_index('ix_chat_message_session_seq', table_name='chat_message')
+    op.drop_table('chat_message')
@@ -0,0 +1,30 @@
+"""Add (user_id, started_at DESC, id DESC) index to chat_session
+
+Revision ID: t5u6v7w8x9y0
+Revises: s4t5u6v7w8x9
+Create Date: 2026-01-08 09:00:00.000000
+
+Backs keyset pagination in ChatService.list_sessions.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 't5u6v7w8x9y0'
+down_revision = 's4t5u6v7w8x9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_chat_session_user_started',
+        'chat_session',
+        ['user_id', sa.text('started_at DESC'), sa.text('id DESC')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_chat_session_user_started', table_name='chat_session')
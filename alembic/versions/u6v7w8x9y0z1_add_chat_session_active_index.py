@@ -0,0 +1,31 @@
+"""Add partial (user_id, id) WHERE status = 'active' index to chat_session
+
+Revision ID: u6v7w8x9y0z1
+Revises: t5u6v7w8x9y0
+Create Date: 2026-01-09 09:00:00.000000
+
+Backs ChatService.get_active_session, which runs on every chat turn.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'u6v7w8x9y0z1'
+down_revision = 't5u6v7w8x9y0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_chat_session_active',
+        'chat_session',
+        ['user_id', 'id'],
+        unique=False,
+        postgresql_where=sa.text("status = 'active'")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_chat_session_active', table_name='chat_session')
@@ -0,0 +1,30 @@
+"""Add (user_id, status, uploaded_at DESC) index to document
+
+Revision ID: v7w8x9y0z1a2
+Revises: u6v7w8x9y0z1
+Create Date: 2026-01-10 09:00:00.000000
+
+Backs keyset pagination in FileService.list_files.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'v7w8x9y0z1a2'
+down_revision = 'u6v7w8x9y0z1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_document_user_status_uploaded',
+        'document',
+        ['user_id', 'status', sa.text('uploaded_at DESC')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_document_user_status_uploaded', table_name='document')
@@ -0,0 +1,33 @@
+"""Add sha256 column and (user_id, sha256) index to document
+
+Revision ID: w8x9y0z1a2b3
+Revises: v7w8x9y0z1a2
+Create Date: 2026-01-12 09:00:00.000000
+
+Lets FileService.create_file find an identical earlier upload of the same
+user and reuse its stored file instead of uploading the bytes again.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'w8x9y0z1a2b3'
+down_revision = 'v7w8x9y0z1a2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('document', sa.Column('sha256', sa.String(length=64), nullable=True))
+    op.create_index(
+        'ix_document_user_sha256',
+        'document',
+        ['user_id', 'sha256'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_document_user_sha256', table_name='document')
+    op.drop_column('document', 'sha256')
@@ -0,0 +1,33 @@
+"""Add (user_id, uploaded_at DESC) INCLUDE (status, file_size) index to document
+
+Revision ID: x9y0z1a2b3c4
+Revises: w8x9y0z1a2b3
+Create Date: 2026-01-12 10:00:00.000000
+
+Serves the newest-first file listing of a user without a status filter
+(FileService.list_files) in index order, with status and size available
+from the index.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'x9y0z1a2b3c4'
+down_revision = 'w8x9y0z1a2b3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_document_user_uploaded',
+        'document',
+        ['user_id', sa.text('uploaded_at DESC')],
+        unique=False,
+        postgresql_include=['status', 'file_size']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_document_user_uploaded', table_name='document')
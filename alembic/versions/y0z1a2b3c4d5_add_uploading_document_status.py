@@ -0,0 +1,33 @@
+"""Add UPLOADING to documentstatus enum
+
+Revision ID: y0z1a2b3c4d5
+Revises: x9y0z1a2b3c4
+Create Date: 2026-01-14 09:00:00.000000
+
+FileService.create_file reserves the document row (UPLOADING) before the
+storage upload and flips it to UPLOADED afterwards.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'y0z1a2b3c4d5'
+down_revision = 'x9y0z1a2b3c4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # New enum values can't be used in the transaction that adds them
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE documentstatus ADD VALUE IF NOT EXISTS 'UPLOADING'")
+
+
+def downgrade() -> None:
+    # Unfinished uploads have no usable file; recreate the enum without the value
+    op.execute("DELETE FROM document WHERE status = 'UPLOADING'")
+    op.execute("ALTER TYPE documentstatus RENAME TO documentstatus_old")
+    op.execute("CREATE TYPE documentstatus AS ENUM ('UPLOADED', 'PROCESSING', 'PROCESSED', 'FAILED')")
+    op.execute("ALTER TABLE document ALTER COLUMN status TYPE documentstatus USING status::text::documentstatus")
+    op.execute("DROP TYPE documentstatus_old")
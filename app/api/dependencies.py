@@ -1,6 +1,5 @@
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
 from sqlalchemy.orm import Session
 from app.core.config import settings
 from app.core.database import get_db
@@ -26,6 +25,8 @@ async def get_current_user(
     Raises:
         HTTPException 401: If token is invalid or user not found
     """
+    from jose import JWTError, jwt  # deferred: keeps python-jose off the import path
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.api.dependencies import get_current_user
@@ -26,15 +27,16 @@ async def register(
     - **full_name**: User's full name
     """
     # Check if email already exists
-    existing_user = auth_service.get_user_by_email(db, user_data.email)
-    if existing_user:
+    if auth_service.email_exists(db, user_data.email):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
 
     # Create new user (auto-assigned as student)
-    user = auth_service.create_user(
+    # bcrypt hashing is CPU-bound, keep it off the event loop
+    user = await run_in_threadpool(
+        auth_service.create_user,
         db=db,
         email=user_data.email,
         password=user_data.password,
@@ -57,8 +59,11 @@ async def login(
 
     Returns JWT access token valid for 1 day (24 hours).
     """
-    # Authenticate user
-    user = auth_service.authenticate_user(db, login_data.email, login_data.password)
+    # Authenticate user (bcrypt verify + JWT signing run in the threadpool,
+    # so login bursts don't stall the event loop)
+    user = await run_in_threadpool(
+        auth_service.authenticate_user, db, login_data.email, login_data.password
+    )
 
     if not user:
         raise HTTPException(
@@ -68,7 +73,8 @@ async def login(
         )
 
     # Create access token
-    access_token = auth_service.create_access_token(
+    access_token = await run_in_threadpool(
+        auth_service.create_access_token,
         data={
             "user_id": str(user.id),
             "email": user.email,
@@ -5,11 +5,14 @@ Provides REST API for chat session management and conversation.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 import json
+import orjson
 
 from app.api.dependencies import get_db, get_current_user, get_current_admin, get_current_student, get_llm_service
 from app.models.user import User
@@ -106,6 +109,8 @@ async def list_chat_sessions(
     status_filter: Optional[str] = None,
     limit: int = 50,
     offset: int = 0,
+    before: Optional[datetime] = None,
+    before_id: Optional[UUID] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_student),
     llm_service: LLMService = Depends(get_llm_service),
@@ -116,6 +121,9 @@ async def list_chat_sessions(
     Returns sessions ordered by most recent first.
     Supports filtering by status and pagination.
 
+    - **before** / **before_id**: `started_at` and `id` of the last session of
+      the previous page (keyset pagination, preferred over **offset**)
+
     **Student only.**
     """
     try:
@@ -135,7 +143,9 @@ async def list_chat_sessions(
             user_id=current_user.id,
             status=status_enum,
             limit=limit,
-            offset=offset
+            offset=offset,
+            before=before,
+            before_id=before_id
         )
 
         return SessionListResponse(
@@ -191,10 +201,15 @@ async def get_chat_session(
                 detail=f"Session {session_id} not found"
             )
 
-        # Convert to dict and add model_name
+        # Convert to dict and add model_name; messages come from chat_message
+        messages = chat_service.get_session_messages(session.id)
         session_dict = {
             **session.__dict__,
-            "model_name": session.model.display_name if session.model else None
+            "model_name": session.model.display_name if session.model else None,
+            "messages": messages,
+            "interaction_messages": [
+                {"role": msg["role"], "content": msg["content"]} for msg in messages
+            ]
         }
 
         # Remove SQLAlchemy internal attributes
@@ -336,17 +351,12 @@ async def send_message(
             )
 
             # Get session to determine which model/provider is being used
-            # Use eager loading to fetch model relationship
-            from app.models.chat_session import ChatSession
-            session = db.query(ChatSession).options(
-                joinedload(ChatSession.model)
-            ).filter(
-                ChatSession.id == session_id,
-                ChatSession.user_id == current_user.id
-            ).first()
+            # (the model comes with the same SELECT and the session is handed
+            # to send_message_stream, so it is loaded only once)
+            session = await run_in_threadpool(chat_service.get_active_session, session_id, current_user.id)
 
             if not session:
-                raise ValueError(f"Session {session_id} not found")
+                raise ValueError(f"Session {session_id} not found or not active")
 
             # Get appropriate API key based on model provider
             api_key = None
@@ -366,10 +376,17 @@ async def send_message(
                 user_id=current_user.id,
                 message_content=request.message,
                 api_key=api_key,
-                use_rag=True  # Enable RAG by default - LLM decides if it needs to search
+                use_rag=True,  # Enable RAG by default - LLM decides if it needs to search
+                session=session
             ):
                 event_count += 1
                 event_type = event.get("type", "UNKNOWN")
+
+                if event_type == "chunk":
+                    # Hot path (one event per token): frame straight to bytes, no logging
+                    yield b"event: chunk\ndata: " + orjson.dumps({"content": event["content"]}) + b"\n\n"
+                    continue
+
                 # Normalize event_type: strip whitespace and convert to lowercase for comparison
                 event_type_normalized = event_type.strip().lower() if isinstance(event_type, str) else str(event_type).strip().lower()
                 content = event.get("content", {})
@@ -398,9 +415,6 @@ async def send_message(
                     # RAG tool result event
                     logger.info(f"[SSE] Forwarding rag_search_result event: {content}")
                     yield f"event: rag_search_result\ndata: {json.dumps(content)}\n\n"
-                elif event_type_normalized == "chunk":
-                    # Text chunk from LLM response
-                    yield f"event: chunk\ndata: {json.dumps({'content': content})}\n\n"
                 elif event_type_normalized == "done":
                     # Final response with sources and tool_calls
                     # event dict structure: {"type": "done", "content": {...}, "sources": [...], "tool_calls": [...]}
@@ -453,7 +467,11 @@ async def get_chat_config(
     """
     try:
         # Get all models, ordered by priority (lower order = higher priority)
-        models = db.query(Model).order_by(Model.order, Model.name).all()
+        models = (
+            db.query(Model.id, Model.name, Model.display_name, Model.provider)
+            .order_by(Model.order, Model.name)
+            .all()
+        )
         model_infos = [
             ModelInfo(
                 id=model.id,
@@ -464,8 +482,12 @@ async def get_chat_config(
             for model in models
         ]
 
-        # Get active prompt
-        active_prompt = db.query(Prompt).filter(Prompt.is_active == True).first()
+        # Get active prompt (only the listed columns, not the prompt content)
+        active_prompt = (
+            db.query(Prompt.id, Prompt.name, Prompt.description)
+            .filter(Prompt.is_active == True)
+            .first()
+        )
         active_prompt_info = None
         if active_prompt:
             active_prompt_info = PromptInfo(
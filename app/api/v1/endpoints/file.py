@@ -6,11 +6,14 @@ Supports PDF file operations for learning materials.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File as FastAPIFile
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.orm import Session
+from typing import List
 from uuid import UUID
+import os
 import uuid
 from io import BytesIO
+import asyncio
 
 from app.api.dependencies import get_db, get_current_user, get_current_admin
 from app.models.user import User
@@ -30,6 +33,25 @@ logger = get_logger(__name__)
 
 router = APIRouter(prefix="/files", tags=["Files"])
 
+# Maximum size of an uploaded file
+MAX_UPLOAD_SIZE = 50 * 1024 * 1024  # 50MB
+
+
+def _get_upload_size(file: UploadFile) -> int:
+    """
+    Get the size of an uploaded file without reading it into memory.
+
+    UploadFile is spooled to a temporary file by the multipart parser, so the
+    size can be taken from the parser (or by seeking to the end). The file is
+    left positioned at the start.
+    """
+    size = file.size
+    if size is None:
+        file.file.seek(0, os.SEEK_END)
+        size = file.file.tell()
+    file.file.seek(0)
+    return size
+
 
 # Diagnostic schemas
 class FileDownloadDiagnostics(BaseModel):
@@ -79,27 +101,26 @@ async def upload_file(
                 detail="File must have a filename"
             )
 
-        # Read file content
-        content = await file.read()
-
         # Validate file size (max 50MB)
-        max_size = 50 * 1024 * 1024  # 50MB
-        if len(content) > max_size:
+        size = _get_upload_size(file)
+        if size > MAX_UPLOAD_SIZE:
             raise HTTPException(
                 status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail=f"File size exceeds maximum allowed size of {max_size / (1024*1024):.0f}MB"
+                detail=f"File size exceeds maximum allowed size of {MAX_UPLOAD_SIZE / (1024*1024):.0f}MB"
             )
 
         # Generate unique filename
         file_id = str(uuid.uuid4())
 
-        # Create file using service
+        # Create file using service (blocking storage/DB I/O, off the event loop)
         file_service = FileService(db=db)
-        document = file_service.create_file(
+        document = await asyncio.to_thread(
+            file_service.create_file,
             user_id=current_user.id,
             filename=file_id,
             original_filename=file.filename,
-            content=content,
+            stream=file.file,
+            size=size,
             mime_type=file.content_type or "application/pdf"
         )
 
@@ -117,6 +138,74 @@ async def upload_file(
         )
 
 
+@router.post(
+    "/upload/bulk",
+    response_model=List[FileUploadResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Upload several PDF files"
+)
+async def upload_files_bulk(
+    files: List[UploadFile] = FastAPIFile(...),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Upload several PDF files in one request.
+
+    - **files**: PDF files to upload (required)
+
+    Files are uploaded to storage concurrently and recorded together; if any
+    file fails, none of them is kept.
+
+    **Requires authentication.**
+    """
+    try:
+        items = []
+        for file in files:
+            if file.content_type not in ["application/pdf"]:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Only PDF files are allowed: {file.filename}"
+                )
+
+            if not file.filename:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="File must have a filename"
+                )
+
+            size = _get_upload_size(file)
+            if size > MAX_UPLOAD_SIZE:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"File {file.filename} exceeds maximum allowed size of {MAX_UPLOAD_SIZE / (1024*1024):.0f}MB"
+                )
+
+            items.append((
+                str(uuid.uuid4()),
+                file.filename,
+                file.file,
+                size,
+                file.content_type or "application/pdf"
+            ))
+
+        file_service = FileService(db=db)
+        documents = await file_service.create_files_bulk(user_id=current_user.id, files=items)
+
+        logger.info(f"{len(documents)} files uploaded by user {current_user.id}")
+
+        return [FileUploadResponse.model_validate(document) for document in documents]
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error uploading files: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to upload files: {str(e)}"
+        )
+
+
 @router.get(
     "",
     response_model=FileListResponse,
@@ -370,6 +459,28 @@ async def download_file(
         document = file_service.get_file(file_id_str)
         logger.info(f"[download] Starting download: {document.original_filename} ({document.file_size} bytes)")
 
+        # Encode filename using RFC 5987 for proper Unicode support in HTTP headers
+        # This handles filenames with special characters like emojis
+        from urllib.parse import quote
+
+        # RFC 5987 encoding: filename*=UTF-8''percent-encoded-filename
+        # The quote() function will percent-encode the string
+        safe_filename = quote(document.original_filename, safe='')
+        download_headers = {
+            "Content-Disposition": f"attachment; filename*=UTF-8''{safe_filename}",
+            "Cache-Control": "no-cache, no-store, must-revalidate",
+        }
+
+        # Local storage: let the server send the file directly (no Python
+        # generator copying chunks, and Content-Length is known)
+        local_path = file_service.get_local_file_path(document)
+        if local_path is not None:
+            return FileResponse(
+                local_path,
+                media_type=document.mime_type or "application/pdf",
+                headers=download_headers
+            )
+
         # Calculate optimal chunk size based on file size (for faster streaming)
         # Larger files use larger chunks for better throughput
         file_size = document.file_size or 0
@@ -393,22 +504,10 @@ async def download_file(
 
         # Return file as streaming response with proper headers
         # Note: Do NOT set Content-Length with StreamingResponse - it uses chunked transfer encoding
-
-        # Encode filename using RFC 5987 for proper Unicode support in HTTP headers
-        # This handles filenames with special characters like emojis
-        from urllib.parse import quote
-
-        # RFC 5987 encoding: filename*=UTF-8''percent-encoded-filename
-        # The quote() function will percent-encode the string
-        safe_filename = quote(document.original_filename, safe='')
-
         return StreamingResponse(
             file_iterator(),
             media_type=document.mime_type or "application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename*=UTF-8''{safe_filename}",
-                "Cache-Control": "no-cache, no-store, must-revalidate",
-            }
+            headers=download_headers
         )
 
     except FileNotFoundError:
@@ -99,22 +99,11 @@ async def semantic_search(
             similarity_threshold=similarity_threshold
         )
 
-        # Convert results to schema objects
-        search_results = [
-            RAGSearchResult(
-                chunk_id=r["chunk_id"],
-                content=r["content"],
-                document_id=r["document_id"],
-                filename=r["filename"],
-                page=r["page"],
-                similarity_score=r["similarity_score"],
-                chunk_index=r["chunk_index"],
-                metadata=r.get("metadata")
-            )
-            for r in results
-        ]
-
-        return RAGSearchResponse(
+        # Rows come straight from our own pgvector query (already typed by the
+        # service), so build the schema objects without re-running validation
+        search_results = [RAGSearchResult.model_construct(**r) for r in results]
+
+        return RAGSearchResponse.model_construct(
             query=query,
             results=search_results,
             count=len(search_results),
@@ -13,7 +13,6 @@ from sqlalchemy import func
 from app.api.dependencies import get_db, get_current_admin
 from app.models.user import User
 from app.models.chat_session import ChatSession
-from app.schemas.user import UserResponse
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -21,11 +20,6 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/users", tags=["User Management"])
 
 
-class UserWithChatCount(UserResponse):
-    """User response with chat session count"""
-    chat_count: int
-
-
 @router.get("", response_model=dict)
 async def list_users(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
@@ -13,6 +13,7 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440  # 1 day = 24 hours * 60 minutes
+    BCRYPT_ROUNDS: int = 12  # bcrypt work factor (lower it only for seeding/dev environments)
 
     # Application
     PROJECT_NAME: str = "System LLM"
@@ -35,6 +36,7 @@ class Settings(BaseSettings):
     GCS_BUCKET_NAME: str = "system-llm-storage"
     GCS_PROJECT_ID: str = "system-llm"
     GCS_CREDENTIALS_PATH: Optional[str] = None  # Path to JSON credentials file (optional, uses ADC/IAM if None)
+    DOWNLOAD_CHUNK_SIZE: int = 8 * 1024 * 1024  # Default chunk size for streaming stored files (bytes)
 
     @property
     def cors_origins(self) -> List[str]:
@@ -1,8 +1,14 @@
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
+
+def _json_serializer(value) -> str:
+    """Serialize JSON/JSONB bind values with orjson (non-str keys allowed, like json.dumps)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
 # Create database engine with connection pooling
 engine = create_engine(
     settings.DATABASE_URL,
@@ -14,6 +20,9 @@ engine = create_engine(
     connect_args={
         "connect_timeout": 10,
     },
+    # orjson codec for JSON/JSONB columns (real_messages, sources, ...)
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
     echo=settings.DEBUG      # Log SQL queries in debug mode
 )
 
@@ -1,19 +1,73 @@
+from calendar import timegm
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
-from passlib.context import CryptContext
-from jose import JWTError, jwt
+import bcrypt
 from app.core.config import settings
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt work factor, read once from settings
+BCRYPT_ROUNDS = settings.BCRYPT_ROUNDS
+
+# bcrypt only uses the first 72 bytes of a password (same truncation passlib applied)
+_BCRYPT_MAX_BYTES = 72
+
+
+def _encode_password(password: str) -> bytes:
+    """Encode a password for bcrypt, truncated to the 72-byte bcrypt limit"""
+    return password.encode("utf-8")[:_BCRYPT_MAX_BYTES]
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return bcrypt.checkpw(_encode_password(plain_password), hashed_password.encode("utf-8"))
+    except ValueError:
+        # Malformed / non-bcrypt hash stored in the database
+        return False
+
+def get_password_hash(password: str, rounds: Optional[int] = None) -> str:
+    """Hash a password (rounds defaults to settings.BCRYPT_ROUNDS)"""
+    salt = bcrypt.gensalt(rounds=rounds or BCRYPT_ROUNDS)
+    return bcrypt.hashpw(_encode_password(password), salt).decode("utf-8")
+
+@lru_cache(maxsize=1)
+def get_dummy_password_hash() -> str:
+    """
+    Hash used to burn a bcrypt verification when no user matches a login.
+
+    Computed on first use (not at import) so startup doesn't pay a bcrypt round.
+    """
+    return get_password_hash("x" * 32)
+
+@lru_cache(maxsize=1)
+def _get_signing_key():
+    """
+    Build the JWT signing key once per process.
+
+    jwt.encode re-runs jwk.construct on SECRET_KEY for every token; the
+    constructed key is immutable, so it is reused for all signatures.
+    """
+    from jose import jwk  # deferred: python-jose is only needed once a token is issued
+
+    return jwk.construct(settings.SECRET_KEY, settings.ALGORITHM)
+
+def sign_jwt_claims(claims: dict) -> str:
+    """
+    Sign JWT claims with the cached signing key
+
+    Args:
+        claims: Claims to encode; datetime values for "exp" are converted
+            to NumericDate like jwt.encode does
 
-def get_password_hash(password: str) -> str:
-    """Hash a password"""
-    return pwd_context.hash(password)
+    Returns:
+        Encoded JWT token
+    """
+    from jose import jws  # deferred, see _get_signing_key
+
+    exp = claims.get("exp")
+    if isinstance(exp, datetime):
+        claims = {**claims, "exp": timegm(exp.utctimetuple())}
+
+    return jws.sign(claims, _get_signing_key(), algorithm=settings.ALGORITHM)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
@@ -34,7 +88,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    encoded_jwt = sign_jwt_claims(to_encode)
 
     return encoded_jwt
 
@@ -48,6 +102,8 @@ def decode_access_token(token: str) -> Optional[dict]:
     Returns:
         Decoded token data or None if invalid
     """
+    from jose import JWTError, jwt  # deferred, see _get_signing_key
+
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         return payload
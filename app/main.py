@@ -1,5 +1,7 @@
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.sessions import SessionMiddleware
 from sqladmin import Admin
 from app.core.config import settings
@@ -17,7 +19,11 @@ from app.admin import (
     ChatSessionAdmin,
     ChatConfigAdmin,
 )
-from app.services.file_service import initialize_storage_provider
+from app.services.file_service import (
+    FileService,
+    STALE_UPLOAD_SWEEP_INTERVAL_SECONDS,
+    initialize_storage_provider,
+)
 from app.services.llm import LLMService
 
 # Setup logging first
@@ -32,6 +38,7 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,  # C-level JSON encoding for all JSON endpoints
 )
 
 # Add TrustedHost middleware for Cloud Run
@@ -151,6 +158,26 @@ admin.add_view(DocumentChunkAdmin)
 admin.add_view(ChatSessionAdmin)
 admin.add_view(ChatConfigAdmin)
 
+def _sweep_stale_uploads() -> int:
+    """Remove unfinished uploads using a dedicated database session"""
+    from app.core.database import SessionLocal
+    db = SessionLocal()
+    try:
+        return FileService(db=db).sweep_stale_uploads()
+    finally:
+        db.close()
+
+
+async def _sweep_stale_uploads_periodically():
+    """Background task: sweep uploads left UPLOADING by failed requests"""
+    while True:
+        await asyncio.sleep(STALE_UPLOAD_SWEEP_INTERVAL_SECONDS)
+        try:
+            await asyncio.to_thread(_sweep_stale_uploads)
+        except Exception as e:
+            logger.error(f"❌ Stale upload sweep failed: {str(e)}")
+
+
 # Startup event
 @app.on_event("startup")
 async def startup_event():
@@ -178,8 +205,15 @@ async def startup_event():
         logger.error(f"❌ Failed to initialize LLM service: {str(e)}")
         raise
 
+    # Remove uploads that never completed (runs in every worker; deletes are idempotent)
+    app.state.upload_sweeper = asyncio.create_task(_sweep_stale_uploads_periodically())
+
 # Shutdown event
 @app.on_event("shutdown")
 async def shutdown_event():
     """Run on application shutdown"""
     logger.info(f"👋 {settings.PROJECT_NAME} is shutting down...")
+
+    upload_sweeper = getattr(app.state, "upload_sweeper", None)
+    if upload_sweeper is not None:
+        upload_sweeper.cancel()
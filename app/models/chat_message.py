@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.sql import func
+from app.core.database import Base
+import uuid
+
+
+class ChatMessage(Base):
+    """Single message of a chat session (append-only, ordered by seq)"""
+    __tablename__ = "chat_message"
+    __table_args__ = (
+        Index("ix_chat_message_session_seq", "session_id", "seq", unique=True),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    session_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("chat_session.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    seq = Column(Integer, nullable=False)  # 0-based position within the session
+    role = Column(String(20), nullable=False)  # system | user | assistant
+    content = Column(Text, nullable=False)
+    sources = Column(JSONB)  # RAG sources (assistant messages only)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    def __repr__(self):
+        return f"<ChatMessage {self.session_id}:{self.seq} {self.role}>"
@@ -1,7 +1,7 @@
-from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from app.core.database import Base
 import uuid
 import enum
@@ -21,8 +21,22 @@ class ComprehensionLevel(str, enum.Enum):
 
 
 class ChatSession(Base):
-    """Chat session with messages stored as JSONB and analytics fields"""
+    """Chat session with analytics fields (messages live in chat_message)"""
     __tablename__ = "chat_session"
+    __table_args__ = (
+        # Keyset pagination of a user's sessions (ChatService.list_sessions)
+        Index("ix_chat_session_user_started", "user_id", text("started_at DESC"), text("id DESC")),
+        # Active-session lookup on every chat turn (ChatService.get_active_session)
+        Index(
+            "ix_chat_session_active",
+            "user_id",
+            "id",
+            postgresql_where=text("status = 'active'"),
+        ),
+    )
+    # Fetch server defaults (started_at) and SQL-expression updates
+    # (total_messages) via RETURNING, so the row doesn't need a refresh after commit
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("user.id"), nullable=False, index=True)
@@ -30,9 +44,10 @@ class ChatSession(Base):
     model_id = Column(UUID(as_uuid=True), ForeignKey("model.id"), nullable=False, index=True)
     title = Column(String(255))
 
-    # Messages stored as JSONB arrays (three formats)
+    # Display messages (system, user, assistant) are stored one row per message
+    # in the append-only chat_message table, see ChatMessage / chat_messages.
 
-    # INTERACTION_MESSAGES: Simple format for display (100% OpenAI standard)
+    # INTERACTION_MESSAGES: Superseded by chat_message, no longer written
     # Format: [{"role": "system|user|assistant", "content": "..."}]
     interaction_messages = Column(JSONB, nullable=False, default=list)
 
@@ -40,8 +55,7 @@ class ChatSession(Base):
     # Format: [{"role": "system|user|assistant|tool", "content": "...", "tool_calls": [...], "sources": [...]}]
     real_messages = Column(JSONB, nullable=False, default=list)
 
-    # Legacy: Keep old messages column for backward compatibility
-    # TODO: Deprecate after migration complete
+    # Legacy: Superseded by chat_message (backfilled from here), no longer written
     messages = Column(JSONB, nullable=False, default=list)
 
     # Store as String to match database (lowercase values: 'active', 'analyzed')
@@ -54,8 +68,12 @@ class ChatSession(Base):
     persona = Column(Text, nullable=True)               # From User profile
     mission_objective = Column(Text, nullable=True)     # From User profile
 
+    # Fully rendered system prompt (built from the fields above on first message)
+    # NULL = not rendered yet
+    system_prompt_cached = Column(Text, nullable=True)
+
     # Analytics fields
-    total_messages = Column(Integer, default=0)
+    total_messages = Column(Integer, default=0)  # Also the next chat_message.seq
     # Store as String to avoid SQLAlchemy Enum uppercase conversion issues
     # Valid values: "low", "medium", "high" (lowercase only)
     comprehension_level = Column(String(50), nullable=True)
@@ -69,6 +87,13 @@ class ChatSession(Base):
     # Relationships
     user = relationship("User", back_populates="chat_sessions")
     model = relationship("Model", back_populates="chat_sessions")
+    prompt = relationship("Prompt")  # Not used on the chat path (content comes from prompt_cache)
+    chat_messages = relationship(
+        "ChatMessage",
+        order_by="ChatMessage.seq",
+        cascade="all, delete-orphan",
+        passive_deletes=True
+    )
 
     def __repr__(self):
         return f"<ChatSession {self.id} - {self.title or 'Untitled'}>"
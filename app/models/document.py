@@ -1,6 +1,6 @@
-from sqlalchemy import Column, String, BigInteger, DateTime, ForeignKey, Enum as SQLEnum, Text
+from sqlalchemy import Column, String, BigInteger, DateTime, ForeignKey, Index, Enum as SQLEnum, Text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from app.core.database import Base
 import uuid
 import enum
@@ -8,6 +8,7 @@ import enum
 
 class DocumentStatus(str, enum.Enum):
     """Document processing status"""
+    UPLOADING = "uploading"  # Row reserved, storage upload not finished yet
     UPLOADED = "uploaded"
     PROCESSING = "processing"
     PROCESSED = "processed"
@@ -17,6 +18,20 @@ class DocumentStatus(str, enum.Enum):
 class Document(Base):
     """PDF document metadata"""
     __tablename__ = "document"
+    __table_args__ = (
+        # Keyset pagination of a user's documents (FileService.list_files)
+        Index("ix_document_user_status_uploaded", "user_id", "status", text("uploaded_at DESC")),
+        # Newest-first listing of a user's documents without a status filter
+        Index(
+            "ix_document_user_uploaded", "user_id", text("uploaded_at DESC"),
+            postgresql_include=["status", "file_size"]
+        ),
+        # Duplicate-upload lookup (FileService.create_file)
+        Index("ix_document_user_sha256", "user_id", "sha256"),
+    )
+    # Fetch server defaults (uploaded_at) via RETURNING on insert, so new rows
+    # don't need a refresh after commit
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("user.id"), nullable=False, index=True)
@@ -25,6 +40,7 @@ class Document(Base):
     file_path = Column(String(500), nullable=False)
     file_size = Column(BigInteger, nullable=False)
     mime_type = Column(String(100))
+    sha256 = Column(String(64))  # Hex digest of the file content (nullable for older rows)
     content = Column(Text)  # Raw extracted text from PDF (nullable until processed)
     status = Column(SQLEnum(DocumentStatus), default=DocumentStatus.UPLOADED, index=True)
     uploaded_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -1,16 +1,15 @@
 from sqlalchemy import Column, String, DateTime, Integer
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from app.core.database import Base
-import uuid
 
 
 class Model(Base):
     """AI Model registry for LLM models (Llama, Qwen, Phi, etc.)"""
     __tablename__ = "model"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))  # generated by Postgres
     name = Column(String(100), unique=True, nullable=False, index=True)
     display_name = Column(String(255), nullable=False)
     provider = Column(String(100))  # 'ollama', 'openai', 'anthropic', etc.
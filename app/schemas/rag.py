@@ -4,8 +4,127 @@ RAG (Retrieval-Augmented Generation) Request/Response Schemas
 Pydantic models for RAG endpoints to ensure proper API documentation.
 """
 
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Optional, Dict, Any, Literal
+
+
+# OpenAPI examples, defined once at module level and referenced from model_config
+_RAG_SEARCH_RESULT_EXAMPLE = {
+    "chunk_id": "550e8400-e29b-41d4-a716-446655440000",
+    "content": "Network Address Translation (NAT) allows private networks to use private IP addresses...",
+    "document_id": "660e8400-e29b-41d4-a716-446655440000",
+    "filename": "H03 - NAT & OSPF.pdf",
+    "page": 5,
+    "similarity_score": 0.92,
+    "chunk_index": 2,
+    "metadata": {"heading": "NAT Definition"}
+}
+
+_RAG_SOURCE_EXAMPLE = {
+    "document_id": "550e8400-e29b-41d4-a716-446655440000",
+    "filename": "python-basics.pdf",
+    "page": 5,
+    "similarity_score": 0.92
+}
+
+_RAG_SEARCH_RESPONSE_EXAMPLE = {
+    "query": "what is NAT",
+    "results": [
+        {
+            "chunk_id": "550e8400-e29b-41d4-a716-446655440000",
+            "content": "Network Address Translation...",
+            "document_id": "660e8400-e29b-41d4-a716-446655440000",
+            "filename": "H03 - NAT & OSPF.pdf",
+            "page": 5,
+            "similarity_score": 0.92,
+            "chunk_index": 2,
+            "metadata": {"heading": "NAT Definition"}
+        }
+    ],
+    "count": 1,
+    "top_k": 5,
+    "threshold": 0.7
+}
+
+_RAG_CONFIG_RESPONSE_EXAMPLE = {
+    "embeddings": {
+        "provider": "OpenAI",
+        "model": "text-embedding-3-small",
+        "dimensions": 1536,
+        "available": True
+    },
+    "vector_database": {
+        "system": "PostgreSQL with pgvector extension",
+        "similarity_metric": "Cosine similarity (1 - distance)",
+        "available": True
+    },
+    "documents": {
+        "total": 3,
+        "processed": 3,
+        "pending": 0,
+        "total_chunks": 42
+    },
+    "search_settings": {
+        "default_top_k": 5,
+        "min_similarity_threshold": 0.65,
+        "max_results": 20
+    }
+}
+
+_RAG_HEALTH_RESPONSE_EXAMPLE = {
+    "status": "healthy",
+    "embeddings": {
+        "available": True,
+        "model": "text-embedding-3-small (1536 dimensions)"
+    },
+    "pgvector": {
+        "available": True,
+        "total_chunks": 42,
+        "total_documents": 3,
+        "processed_documents": 3
+    },
+    "errors": []
+}
+
+_RAG_SETTINGS_RESPONSE_EXAMPLE = {
+    "id": 1,
+    "updated_at": "2025-11-22T10:30:00Z",
+    "prompt_general": "You are a helpful AI assistant...",
+    "prompt_analysis": "Analyze the student learning session and provide insights...",
+    "prompt_refine": "Refine the user's question to be more specific and clear...",
+    "default_top_k": 5,
+    "max_top_k": 10,
+    "similarity_threshold": 0.7,
+    "tool_calling_max_iterations": 10,
+    "tool_calling_enabled": True,
+    "include_rag_instruction": True
+}
+
+_RAG_SETTINGS_UPDATE_EXAMPLE = {
+    "prompt_general": "You are a helpful AI assistant...",
+    "prompt_analysis": "Analyze the student learning session and provide...",
+    "prompt_refine": "Refine the user's question to be more specific and clear...",
+    "default_top_k": 5,
+    "max_top_k": 10,
+    "similarity_threshold": 0.7,
+    "tool_calling_max_iterations": 10,
+    "tool_calling_enabled": True,
+    "include_rag_instruction": True
+}
+
+_CHAT_MESSAGE_WITH_SOURCES_EXAMPLE = {
+    "role": "assistant",
+    "content": "A loop is a control structure that repeats a block of code...",
+    "created_at": "2025-11-08T10:30:00Z",
+    "sources": [
+        {
+            "document_id": "660e8400-e29b-41d4-a716-446655440000",
+            "filename": "python-basics.pdf",
+            "page": 5,
+            "similarity_score": 0.92
+        }
+    ]
+}
 
 
 class RAGSearchResult(BaseModel):
@@ -19,19 +138,7 @@ class RAGSearchResult(BaseModel):
     chunk_index: int = Field(..., description="Index of this chunk in the document")
     metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata (heading, section, etc.)")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "chunk_id": "550e8400-e29b-41d4-a716-446655440000",
-                "content": "Network Address Translation (NAT) allows private networks to use private IP addresses...",
-                "document_id": "660e8400-e29b-41d4-a716-446655440000",
-                "filename": "H03 - NAT & OSPF.pdf",
-                "page": 5,
-                "similarity_score": 0.92,
-                "chunk_index": 2,
-                "metadata": {"heading": "NAT Definition"}
-            }
-        }
+    model_config = ConfigDict(json_schema_extra={"example": _RAG_SEARCH_RESULT_EXAMPLE})
 
 
 class RAGSource(BaseModel):
@@ -41,15 +148,7 @@ class RAGSource(BaseModel):
     page: Optional[int] = Field(None, description="Page number where content was found")
     similarity_score: float = Field(..., description="Relevance score (0-1)")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "document_id": "550e8400-e29b-41d4-a716-446655440000",
-                "filename": "python-basics.pdf",
-                "page": 5,
-                "similarity_score": 0.92
-            }
-        }
+    model_config = ConfigDict(json_schema_extra={"example": _RAG_SOURCE_EXAMPLE})
 
 
 class RAGSearchRequest(BaseModel):
@@ -67,32 +166,12 @@ class RAGSearchResponse(BaseModel):
     top_k: int = Field(..., description="Requested top-k value")
     threshold: float = Field(..., description="Similarity threshold used")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "query": "what is NAT",
-                "results": [
-                    {
-                        "chunk_id": "550e8400-e29b-41d4-a716-446655440000",
-                        "content": "Network Address Translation...",
-                        "document_id": "660e8400-e29b-41d4-a716-446655440000",
-                        "filename": "H03 - NAT & OSPF.pdf",
-                        "page": 5,
-                        "similarity_score": 0.92,
-                        "chunk_index": 2,
-                        "metadata": {"heading": "NAT Definition"}
-                    }
-                ],
-                "count": 1,
-                "top_k": 5,
-                "threshold": 0.7
-            }
-        }
+    model_config = ConfigDict(json_schema_extra={"example": _RAG_SEARCH_RESPONSE_EXAMPLE})
 
 
 class RAGEmbeddingInfo(BaseModel):
     """Embeddings configuration info."""
-    provider: str = Field(..., description="Embedding provider")
+    provider: Literal["OpenAI"] = Field(..., description="Embedding provider")
     model: str = Field(..., description="Embedding model name")
     dimensions: int = Field(..., description="Embedding vector dimensions")
     available: bool = Field(..., description="Is embeddings service available")
@@ -127,65 +206,23 @@ class RAGConfigResponse(BaseModel):
     documents: RAGDocumentStats = Field(..., description="Document statistics")
     search_settings: RAGSearchSettings = Field(..., description="Search configuration")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "embeddings": {
-                    "provider": "OpenAI",
-                    "model": "text-embedding-3-small",
-                    "dimensions": 1536,
-                    "available": True
-                },
-                "vector_database": {
-                    "system": "PostgreSQL with pgvector extension",
-                    "similarity_metric": "Cosine similarity (1 - distance)",
-                    "available": True
-                },
-                "documents": {
-                    "total": 3,
-                    "processed": 3,
-                    "pending": 0,
-                    "total_chunks": 42
-                },
-                "search_settings": {
-                    "default_top_k": 5,
-                    "min_similarity_threshold": 0.65,
-                    "max_results": 20
-                }
-            }
-        }
+    model_config = ConfigDict(json_schema_extra={"example": _RAG_CONFIG_RESPONSE_EXAMPLE})
 
 
 class RAGHealthResponse(BaseModel):
     """RAG system health status."""
-    status: str = Field(..., description="Overall health status (healthy/degraded)")
+    status: Literal["healthy", "degraded"] = Field(..., description="Overall health status (healthy/degraded)")
     embeddings: Dict[str, Any] = Field(..., description="Embeddings status")
     pgvector: Dict[str, Any] = Field(..., description="pgvector status and statistics")
     errors: List[str] = Field(default_factory=list, description="List of errors if any")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "status": "healthy",
-                "embeddings": {
-                    "available": True,
-                    "model": "text-embedding-3-small (1536 dimensions)"
-                },
-                "pgvector": {
-                    "available": True,
-                    "total_chunks": 42,
-                    "total_documents": 3,
-                    "processed_documents": 3
-                },
-                "errors": []
-            }
-        }
+    model_config = ConfigDict(json_schema_extra={"example": _RAG_HEALTH_RESPONSE_EXAMPLE})
 
 
 class RAGSearchEvent(BaseModel):
     """RAG search event from streaming response."""
     query: str = Field(..., description="Search query")
-    status: str = Field(..., description="Event status (searching/completed)")
+    status: Literal["searching", "completed"] = Field(..., description="Event status (searching/completed)")
     results_count: Optional[int] = Field(None, description="Number of results (only when status=completed)")
 
 
@@ -212,22 +249,7 @@ class RAGSettingsResponse(BaseModel):
     # RAG Behavior
     include_rag_instruction: bool = Field(..., description="Include RAG instruction in system prompt")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "id": 1,
-                "updated_at": "2025-11-22T10:30:00Z",
-                "prompt_general": "You are a helpful AI assistant...",
-                "prompt_analysis": "Analyze the student learning session and provide insights...",
-                "prompt_refine": "Refine the user's question to be more specific and clear...",
-                "default_top_k": 5,
-                "max_top_k": 10,
-                "similarity_threshold": 0.7,
-                "tool_calling_max_iterations": 10,
-                "tool_calling_enabled": True,
-                "include_rag_instruction": True
-            }
-        }
+    model_config = ConfigDict(json_schema_extra={"example": _RAG_SETTINGS_RESPONSE_EXAMPLE})
 
 
 class RAGSettingsUpdate(BaseModel):
@@ -242,42 +264,14 @@ class RAGSettingsUpdate(BaseModel):
     tool_calling_enabled: Optional[bool] = Field(None, description="Enable/disable tool calling")
     include_rag_instruction: Optional[bool] = Field(None, description="Include RAG instruction in system prompt")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "prompt_general": "You are a helpful AI assistant...",
-                "prompt_analysis": "Analyze the student learning session and provide...",
-                "prompt_refine": "Refine the user's question to be more specific and clear...",
-                "default_top_k": 5,
-                "max_top_k": 10,
-                "similarity_threshold": 0.7,
-                "tool_calling_max_iterations": 10,
-                "tool_calling_enabled": True,
-                "include_rag_instruction": True
-            }
-        }
+    model_config = ConfigDict(json_schema_extra={"example": _RAG_SETTINGS_UPDATE_EXAMPLE})
 
 
 class ChatMessageWithSources(BaseModel):
     """Chat message with optional source citations."""
-    role: str = Field(..., description="Message role (user/assistant/system)")
+    role: Literal["user", "assistant", "system"] = Field(..., description="Message role (user/assistant/system)")
     content: str = Field(..., description="Message content")
     created_at: str = Field(..., description="ISO timestamp of creation")
     sources: Optional[List[RAGSource]] = Field(None, description="Source documents for RAG-based responses")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "role": "assistant",
-                "content": "A loop is a control structure that repeats a block of code...",
-                "created_at": "2025-11-08T10:30:00Z",
-                "sources": [
-                    {
-                        "document_id": "660e8400-e29b-41d4-a716-446655440000",
-                        "filename": "python-basics.pdf",
-                        "page": 5,
-                        "similarity_score": 0.92
-                    }
-                ]
-            }
-        }
+    model_config = ConfigDict(json_schema_extra={"example": _CHAT_MESSAGE_WITH_SOURCES_EXAMPLE})
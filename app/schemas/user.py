@@ -1,38 +1,44 @@
-from pydantic import BaseModel, EmailStr, ConfigDict, field_serializer
+import re
+from pydantic import BaseModel, EmailStr, ConfigDict, Field
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Optional
 from uuid import UUID
 from app.models.user import UserRole
 
+# Lightweight email check for emails that were already validated with EmailStr
+# at signup (responses / DB rows); full EmailStr parsing stays on input schemas
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+Email = Annotated[str, Field(pattern=EMAIL_RE.pattern)]
+
 
 class UserBase(BaseModel):
     """Base user schema"""
-    email: EmailStr
+    email: Email
     full_name: str
 
 
 class UserCreate(UserBase):
     """Schema for creating a user"""
+    email: EmailStr
     password: str
     role: Optional[UserRole] = UserRole.STUDENT
 
 
-class UserResponse(UserBase):
-    """Schema for user response (without password)"""
+class UserInDBBase(UserBase):
+    """Shared fields for schemas built from a stored user row"""
     id: UUID
     role: UserRole
-    task: Optional[str] = None
-    persona: Optional[str] = None
-    mission_objective: Optional[str] = None
     created_at: datetime
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
 
-    @field_serializer('id')
-    def serialize_id(self, value: UUID) -> str:
-        """Convert UUID to string for JSON serialization"""
-        return str(value)
+
+class UserResponse(UserInDBBase):
+    """Schema for user response (without password)"""
+    task: Optional[str] = None
+    persona: Optional[str] = None
+    mission_objective: Optional[str] = None
 
 
 class UserProfileUpdate(BaseModel):
@@ -42,12 +48,6 @@ class UserProfileUpdate(BaseModel):
     mission_objective: Optional[str] = None
 
 
-class UserInDB(UserBase):
+class UserInDB(UserInDBBase):
     """Schema for user in database (with hashed password)"""
-    id: UUID
     password_hash: str
-    role: UserRole
-    created_at: datetime
-    updated_at: datetime
-
-    model_config = ConfigDict(from_attributes=True)
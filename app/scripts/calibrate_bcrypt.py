@@ -0,0 +1,67 @@
+"""
+Calibration script to pick a bcrypt work factor for this host.
+
+Each extra round doubles the hashing cost, so the script walks the rounds
+upward, times one hash per step, and reports the highest cost that still
+fits the target latency window. Put the result in BCRYPT_ROUNDS.
+
+Usage:
+    docker exec system-llm-api python -m app.scripts.calibrate_bcrypt
+
+Environment variables (optional):
+    BCRYPT_TARGET_MIN_MS: Lower bound of the target window (default: 200)
+    BCRYPT_TARGET_MAX_MS: Upper bound of the target window (default: 400)
+"""
+
+import os
+import timeit
+import bcrypt
+from app.core.config import settings
+
+# bcrypt's valid cost range
+MIN_ROUNDS = 4
+MAX_ROUNDS = 16
+
+# Timed samples per round (best-of to reduce scheduler noise)
+SAMPLES = 3
+
+
+def time_hash_ms(rounds: int) -> float:
+    """Best-of-SAMPLES time for one bcrypt hash at the given cost, in ms"""
+    password = b"calibration-password"
+    salt = bcrypt.gensalt(rounds=rounds)
+    timings = timeit.repeat(lambda: bcrypt.hashpw(password, salt), number=1, repeat=SAMPLES)
+    return min(timings) * 1000
+
+
+def calibrate():
+    """Find the highest bcrypt cost whose hash time stays within the target window"""
+    target_min_ms = float(os.getenv("BCRYPT_TARGET_MIN_MS", "200"))
+    target_max_ms = float(os.getenv("BCRYPT_TARGET_MAX_MS", "400"))
+
+    print(f"🔧 Calibrating bcrypt (target {target_min_ms:.0f}-{target_max_ms:.0f} ms per hash)")
+    print(f"   Current BCRYPT_ROUNDS: {settings.BCRYPT_ROUNDS}")
+
+    best_rounds = None
+    for rounds in range(MIN_ROUNDS, MAX_ROUNDS + 1):
+        elapsed_ms = time_hash_ms(rounds)
+        print(f"   rounds={rounds:2d}: {elapsed_ms:8.1f} ms")
+
+        if elapsed_ms > target_max_ms:
+            break
+        best_rounds = rounds
+
+    if best_rounds is None:
+        print(f"❌ Even rounds={MIN_ROUNDS} exceeds {target_max_ms:.0f} ms on this host")
+        return
+
+    best_ms = time_hash_ms(best_rounds)
+    if best_ms < target_min_ms:
+        print(f"⚠️  rounds={best_rounds} ({best_ms:.1f} ms) is below the target window; "
+              f"rounds={best_rounds + 1} would exceed {target_max_ms:.0f} ms")
+
+    print(f"✅ Recommended: BCRYPT_ROUNDS={best_rounds} ({best_ms:.1f} ms per hash)")
+
+
+if __name__ == "__main__":
+    calibrate()
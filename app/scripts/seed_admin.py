@@ -8,9 +8,11 @@ Environment variables (optional):
     ADMIN_EMAIL: Admin email (default: admin@example.com)
     ADMIN_PASSWORD: Admin password (default: admin123)
     ADMIN_FULL_NAME: Admin full name (default: System Administrator)
+    ADMIN_BCRYPT_ROUNDS: bcrypt work factor for the seeded hash (default: BCRYPT_ROUNDS setting)
 """
 
 import os
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.core.database import SessionLocal
 from app.models.user import User, UserRole
@@ -26,42 +28,50 @@ def create_admin():
         admin_email = os.getenv("ADMIN_EMAIL", "admin@example.com").strip()
         admin_password = os.getenv("ADMIN_PASSWORD", "admin123").strip()
         admin_full_name = os.getenv("ADMIN_FULL_NAME", "System Administrator").strip()
+        admin_bcrypt_rounds = int(os.getenv("ADMIN_BCRYPT_ROUNDS", "0")) or None
 
         # Validate admin email
         if not admin_email or "@" not in admin_email:
             print("❌ Invalid admin email format!")
             return
 
-        # Check if admin already exists with same email
-        existing_admin = db.query(User).filter(User.email == admin_email).first()
+        # Single query for both checks: a user with the same email (preferred)
+        # or any existing admin
+        existing_user = (
+            db.query(User)
+            .filter((User.email == admin_email) | (User.role == UserRole.ADMIN))
+            .order_by((User.email == admin_email).desc())
+            .first()
+        )
 
-        if existing_admin:
+        # Check if admin already exists with same email
+        if existing_user and existing_user.email == admin_email:
             print("ℹ️  Admin user already exists!")
-            print(f"   Email: {existing_admin.email}")
-            print(f"   Full Name: {existing_admin.full_name}")
-            print(f"   Role: {existing_admin.role.value}")
-            print(f"   Created: {existing_admin.created_at}")
+            print(f"   Email: {existing_user.email}")
+            print(f"   Full Name: {existing_user.full_name}")
+            print(f"   Role: {existing_user.role.value}")
+            print(f"   Created: {existing_user.created_at}")
             return
 
-        # Check if any admin exists at all
-        any_admin = db.query(User).filter(User.role == UserRole.ADMIN).first()
-        if any_admin:
+        # Otherwise the match is some other admin
+        if existing_user:
             print("⚠️  Admin user already exists in database!")
-            print(f"   Email: {any_admin.email}")
+            print(f"   Email: {existing_user.email}")
             print(f"   To create additional admin, change ADMIN_EMAIL environment variable")
             return
 
-        # Create admin user
-        admin = User(
-            email=admin_email,
-            password_hash=get_password_hash(admin_password),
-            full_name=admin_full_name,
-            role=UserRole.ADMIN
-        )
-
-        db.add(admin)
+        # Create admin user (RETURNING fetches the stored row in the same round trip)
+        admin = db.execute(
+            insert(User)
+            .values(
+                email=admin_email,
+                password_hash=get_password_hash(admin_password, rounds=admin_bcrypt_rounds),
+                full_name=admin_full_name,
+                role=UserRole.ADMIN
+            )
+            .returning(User.id, User.email, User.full_name, User.role, User.created_at)
+        ).one()
         db.commit()
-        db.refresh(admin)
 
         print("✅ Admin user created successfully!")
         print(f"   Email: {admin.email}")
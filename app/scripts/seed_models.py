@@ -6,6 +6,7 @@ Run this script using:
 python -m app.scripts.seed_models
 """
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.core.database import SessionLocal, engine
 from app.models.model import Model
@@ -45,23 +46,29 @@ def seed_models(db: Session):
     created_count = 0
     skipped_count = 0
 
-    for model_data in default_models:
-        # Check if model already exists
-        existing_model = (
-            db.query(Model).filter(Model.name == model_data["name"]).first()
+    # Check which models already exist in a single query
+    existing_names = {
+        name
+        for (name,) in db.query(Model.name).filter(
+            Model.name.in_([m["name"] for m in default_models])
         )
+    }
 
-        if existing_model:
+    new_models = []
+    for model_data in default_models:
+        if model_data["name"] in existing_names:
             logger.info(f"Model '{model_data['name']}' already exists. Skipping...")
             skipped_count += 1
             continue
 
-        # Create new model
-        new_model = Model(**model_data)
-        db.add(new_model)
+        new_models.append(model_data)
         logger.info(f"Created model: {model_data['display_name']} ({model_data['name']})")
         created_count += 1
 
+    # Insert all new models in one executemany batch (no per-row ORM flush)
+    if new_models:
+        db.execute(insert(Model), new_models)
+
     # Commit changes
     db.commit()
 
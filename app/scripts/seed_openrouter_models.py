@@ -11,7 +11,7 @@ Usage:
 """
 
 import logging
-from uuid import uuid4
+from sqlalchemy import insert
 from app.core.database import SessionLocal
 from app.models.model import Model
 
@@ -48,32 +48,35 @@ def seed_openrouter_models():
             }
         ]
 
-        # Add models to database
-        added_count = 0
-        for model_data in openrouter_models:
-            # Check if model already exists
-            existing = db.query(Model).filter(
-                Model.name == model_data["name"]
-            ).first()
+        # Check which models already exist in a single query
+        existing_names = {
+            name
+            for (name,) in db.query(Model.name).filter(
+                Model.name.in_([m["name"] for m in openrouter_models])
+            )
+        }
 
-            if existing:
+        # Collect new rows, then insert them in one executemany batch
+        new_rows = []
+        for model_data in openrouter_models:
+            if model_data["name"] in existing_names:
                 print(f"⏭️  Model already exists: {model_data['display_name']}")
                 continue
 
-            # Create new model
-            model = Model(
-                id=uuid4(),
-                name=model_data["name"],
-                display_name=model_data["display_name"],
-                provider=model_data["provider"],
-                api_endpoint="https://openrouter.ai/api/v1",
-                order=model_data["order"]
-            )
-
-            db.add(model)
-            added_count += 1
+            # id is generated server-side (gen_random_uuid() default)
+            new_rows.append({
+                "name": model_data["name"],
+                "display_name": model_data["display_name"],
+                "provider": model_data["provider"],
+                "api_endpoint": "https://openrouter.ai/api/v1",
+                "order": model_data["order"]
+            })
             print(f"✅ Added model: {model_data['display_name']}")
 
+        if new_rows:
+            db.execute(insert(Model), new_rows)
+        added_count = len(new_rows)
+
         # Commit changes
         db.commit()
         print(f"\n✅ Successfully added {added_count} OpenRouter models!")
@@ -1,9 +1,8 @@
 from datetime import datetime, timedelta
 from typing import Optional
-from jose import jwt
 from sqlalchemy.orm import Session
 from app.core.config import settings
-from app.core.security import verify_password, get_password_hash
+from app.core.security import verify_password, get_password_hash, get_dummy_password_hash, sign_jwt_claims
 from app.models.user import User, UserRole
 from app.schemas.auth import TokenData
 
@@ -35,7 +34,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     print(f"[DEBUG] ALGORITHM: {settings.ALGORITHM}")
     print(f"[DEBUG] Data to encode: {to_encode}")
 
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    encoded_jwt = sign_jwt_claims(to_encode)
 
     print(f"[DEBUG] Token created, length: {len(encoded_jwt)}")
     print(f"[DEBUG] Token first 50 chars: {encoded_jwt[:50]}...")
@@ -57,15 +56,18 @@ def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
     Returns:
         User object if authentication successful, None otherwise
     """
-    user = db.query(User).filter(User.email == email).first()
+    # Only fetch the hash; the full row is loaded after the password checks out
+    credentials = db.query(User.id, User.password_hash).filter(User.email == email).first()
 
-    if not user:
+    if not credentials:
+        # Verify against a dummy hash so unknown emails take as long as wrong passwords
+        verify_password(password, get_dummy_password_hash())
         return None
 
-    if not verify_password(password, user.password_hash):
+    if not verify_password(password, credentials.password_hash):
         return None
 
-    return user
+    return db.get(User, credentials.id)
 
 
 def create_user(db: Session, email: str, password: str, full_name: str, role: UserRole = UserRole.STUDENT) -> User:
@@ -110,3 +112,17 @@ def get_user_by_email(db: Session, email: str) -> Optional[User]:
         User object if found, None otherwise
     """
     return db.query(User).filter(User.email == email).first()
+
+
+def email_exists(db: Session, email: str) -> bool:
+    """
+    Check whether a user with the given email exists.
+
+    Args:
+        db: Database session
+        email: User email
+
+    Returns:
+        True if a user with this email exists, False otherwise
+    """
+    return db.query(db.query(User.id).filter(User.email == email).exists()).scalar()
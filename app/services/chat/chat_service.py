@@ -5,27 +5,102 @@ Handles chat session management, message storage, and conversation flow.
 Integrates with LLM service for generating responses.
 """
 
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from datetime import datetime
+import asyncio
+import json
+import logging
+import re
+import time
+import orjson
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy import Row, bindparam, delete, event, func, tuple_, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Session, defer, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
+from datetime import datetime, timezone
 from uuid import UUID
 
 from app.models.chat_session import ChatSession, SessionStatus
+from app.models.chat_message import ChatMessage
 from app.models.model import Model
-from app.models.prompt import Prompt
 from app.models.chat_config import ChatConfig
 from app.services.llm import LLMService
-from app.services.rag import RAGService, create_rag_tools
+from app.services.rag import create_rag_tools
+from app.services.chat.prompt_cache import get_active_prompt_id, get_prompt_content
+from app.services.chat import context_cache
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Horizontal rules for the debug dumps below
+_HR_HEAVY = "=" * 100
+_HR_LIGHT = "-" * 100
+
+# Canonical UUID string (what clients send for model ids)
+_UUID_RE = re.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$")
+
+# Lifetime of a memoized _get_model lookup; bounds staleness for other worker
+# processes (the mapper events only clear this process's cache)
+MODEL_CACHE_TTL_SECONDS = 300
+
+# Roles left out of the transcript sent for session analysis
+_ANALYSIS_SKIP_ROLES = frozenset({"system"})
+
+# Streamed text is sent in batches of at most this many LLM chunks, or
+# whatever arrived within this many seconds, whichever comes first
+CHUNK_COALESCE_MAX_CHUNKS = 8
+CHUNK_COALESCE_MAX_DELAY_SECONDS = 0.01
+
+
+class _ChunkCoalescer:
+    """
+    Batch streamed text chunks into fewer SSE frames.
+
+    The delay check runs when a chunk arrives (no timer task), so a batch is
+    released on the chunk that fills it, on the first chunk after the delay,
+    or by an explicit flush() (before other events and at the end of stream).
+    """
+
+    def __init__(self):
+        self._parts: List[str] = []
+        self._last_flush = time.monotonic()
+
+    def add(self, text: str) -> Optional[str]:
+        """Buffer a chunk; return the batched text if it is due, else None."""
+        self._parts.append(text)
+        if (
+            len(self._parts) >= CHUNK_COALESCE_MAX_CHUNKS
+            or time.monotonic() - self._last_flush >= CHUNK_COALESCE_MAX_DELAY_SECONDS
+        ):
+            return self.flush()
+        return None
+
+    def flush(self) -> Optional[str]:
+        """Return and clear the buffered text (None if nothing is buffered)."""
+        if not self._parts:
+            return None
+        text = "".join(self._parts)
+        self._parts.clear()
+        self._last_flush = time.monotonic()
+        return text
+
 
 class ChatService:
     """Service for managing chat sessions and conversations."""
 
+    # Process-wide memo of _get_model lookups: model_id (UUID string or name)
+    # -> (expires_at, (id, display_name) row). Cleared by the Model mapper
+    # events at the bottom of this module; entries expire after
+    # MODEL_CACHE_TTL_SECONDS.
+    _model_cache: Dict[str, Tuple[float, Row]] = {}
+
     def __init__(self, db: Session, llm_service: Optional[LLMService] = None):
+        # Sync Session: the async methods below run its blocking calls through
+        # asyncio.to_thread, one at a time, so the event loop keeps serving
+        # other streams while waiting on Postgres
         self.db = db
+        # Objects stay loaded after commit: every write here already holds the
+        # final state in memory, so a post-commit refresh/reload is wasted work
+        self.db.expire_on_commit = False
         # Use provided singleton or create new instance for testing
         self.llm_service = llm_service if llm_service else LLMService(db=db)
 
@@ -50,18 +125,16 @@ class ChatService:
 
         # If no prompt_id provided, try to use active prompt
         if not prompt_id:
-            active_prompt = self.db.query(Prompt).filter(Prompt.is_active == True).first()
-            if active_prompt:
-                prompt_id = active_prompt.id
-                logger.info(f"Using active prompt: {active_prompt.name} (ID: {prompt_id})")
+            prompt_id = get_active_prompt_id(self.db)
+            if prompt_id:
+                logger.info(f"Using active prompt (ID: {prompt_id})")
             else:
                 logger.info("No active prompt found, creating session without prompt")
         else:
             # Verify provided prompt exists
-            prompt = self.db.query(Prompt).filter(Prompt.id == prompt_id).first()
-            if not prompt:
+            if get_prompt_content(self.db, prompt_id) is None:
                 raise ValueError(f"Prompt with ID '{prompt_id}' not found")
-            logger.info(f"Using provided prompt: {prompt.name} (ID: {prompt_id})")
+            logger.info(f"Using provided prompt (ID: {prompt_id})")
 
         session = ChatSession(
             user_id=user_id,
@@ -79,23 +152,30 @@ class ChatService:
 
         self.db.add(session)
         self.db.commit()
-        self.db.refresh(session)
 
         # Log session creation with all prompt fields
         logger.info(f"[SERVICE] Created chat session {session.id} for user {user_id}")
-        logger.info("[SERVICE] Session Prompt Configuration:")
-        logger.info(f"  - prompt_id (from Prompt table): {session.prompt_id}")
-        logger.info(f"  - prompt_general: {session.prompt_general if session.prompt_general else '(not set)'}")
-        logger.info(f"  - task: {session.task if session.task else '(not set)'}")
-        logger.info(f"  - persona: {session.persona if session.persona else '(not set)'}")
-        logger.info(f"  - mission_objective: {session.mission_objective if session.mission_objective else '(not set)'}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SERVICE] Session Prompt Configuration:")
+            logger.debug(f"  - prompt_id (from Prompt table): {session.prompt_id}")
+            logger.debug(f"  - prompt_general: {session.prompt_general if session.prompt_general else '(not set)'}")
+            logger.debug(f"  - task: {session.task if session.task else '(not set)'}")
+            logger.debug(f"  - persona: {session.persona if session.persona else '(not set)'}")
+            logger.debug(f"  - mission_objective: {session.mission_objective if session.mission_objective else '(not set)'}")
 
         return session
 
     def get_session(self, session_id: UUID, user_id: UUID) -> Optional[ChatSession]:
-        """Get a chat session by ID."""
+        """
+        Get a chat session by ID (with its Model eager-loaded in the same SELECT).
+
+        The Prompt is not joined: it is only read to render the system prompt,
+        which happens once per session (see _render_system_prompt), and its
+        content is served from the prompt cache.
+        """
         session = (
             self.db.query(ChatSession)
+            .options(joinedload(ChatSession.model))
             .filter(
                 ChatSession.id == session_id,
                 ChatSession.user_id == user_id
@@ -104,14 +184,63 @@ class ChatService:
         )
         return session
 
+    def get_session_for_turn(self, session_id: UUID, user_id: UUID) -> Optional[ChatSession]:
+        """
+        Get a chat session for handling a turn, without its JSONB message columns.
+
+        Same as get_session, but messages, interaction_messages and real_messages
+        are deferred (raiseload): a turn only appends to real_messages, which is
+        done in SQL (see send_message_stream), so the arrays never need to be
+        read and detoasted. Accessing one of them raises instead of lazy-loading.
+        """
+        return self._query_session_for_turn(session_id, user_id).first()
+
+    def get_active_session(self, session_id: UUID, user_id: UUID) -> Optional[ChatSession]:
+        """
+        Get an ACTIVE chat session for handling a turn (see get_session_for_turn).
+
+        The status is part of the WHERE clause (served by the partial index
+        ix_chat_session_active), so None means "not found or not active".
+        """
+        return (
+            self._query_session_for_turn(session_id, user_id)
+            .filter(ChatSession.status == SessionStatus.ACTIVE.value)
+            .first()
+        )
+
+    def _query_session_for_turn(self, session_id: UUID, user_id: UUID):
+        """Query for a user's session with Model joined and JSONB columns deferred."""
+        return (
+            self.db.query(ChatSession)
+            .options(
+                joinedload(ChatSession.model),
+                defer(ChatSession.messages, raiseload=True),
+                defer(ChatSession.interaction_messages, raiseload=True),
+                defer(ChatSession.real_messages, raiseload=True),
+            )
+            .filter(
+                ChatSession.id == session_id,
+                ChatSession.user_id == user_id
+            )
+        )
+
     def list_sessions(
         self,
         user_id: UUID,
         status: Optional[SessionStatus] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        before: Optional[datetime] = None,
+        before_id: Optional[UUID] = None
     ) -> List[ChatSession]:
-        """List chat sessions for a user."""
+        """
+        List chat sessions for a user, most recent first.
+
+        Pagination: pass the started_at / id of the last session of the
+        previous page as before / before_id (keyset, served by the
+        ix_chat_session_user_started index). offset is still accepted for
+        older clients but gets slower the deeper the page.
+        """
         query = self.db.query(ChatSession).filter(ChatSession.user_id == user_id)
 
         if status:
@@ -119,13 +248,19 @@ class ChatService:
             status_value = status.value if isinstance(status, SessionStatus) else status
             query = query.filter(ChatSession.status == status_value)
 
-        sessions = (
-            query
-            .order_by(ChatSession.started_at.desc())
-            .limit(limit)
-            .offset(offset)
-            .all()
-        )
+        if before is not None:
+            if before_id is not None:
+                query = query.filter(
+                    tuple_(ChatSession.started_at, ChatSession.id) < tuple_(before, before_id)
+                )
+            else:
+                query = query.filter(ChatSession.started_at < before)
+            offset = 0
+
+        query = query.order_by(ChatSession.started_at.desc(), ChatSession.id.desc()).limit(limit)
+        if offset:
+            query = query.offset(offset)
+        sessions = query.all()
 
         return sessions
 
@@ -137,35 +272,50 @@ class ChatService:
         status: Optional[SessionStatus] = None
     ) -> Optional[ChatSession]:
         """Update a chat session."""
-        session = self.get_session(session_id, user_id)
-        if not session:
-            return None
-
+        changes: Dict[str, Any] = {}
         if title is not None:
-            session.title = title
+            changes["title"] = title
 
         if status is not None:
             # Convert enum to string value for database storage
             status_value = status.value if isinstance(status, SessionStatus) else status
-            session.status = status_value
+            changes["status"] = status_value
             # Mark session as ended if status changed to ANALYZED
             if status_value == SessionStatus.ANALYZED.value:
-                session.ended_at = datetime.utcnow()
+                changes["ended_at"] = datetime.now(timezone.utc)
+
+        if not changes:
+            return self.get_session(session_id, user_id)
+
+        # Single UPDATE ... RETURNING: ownership check and write in one statement
+        session = self.db.execute(
+            update(ChatSession)
+            .where(ChatSession.id == session_id, ChatSession.user_id == user_id)
+            .values(**changes)
+            .returning(ChatSession)
+        ).scalar_one_or_none()
+        if not session:
+            self.db.rollback()
+            return None
 
         self.db.commit()
-        self.db.refresh(session)
 
         logger.info(f"Updated session {session_id}")
         return session
 
     def delete_session(self, session_id: UUID, user_id: UUID) -> bool:
         """Delete a chat session."""
-        session = self.get_session(session_id, user_id)
-        if not session:
+        # Single DELETE; chat_message rows go with it via ON DELETE CASCADE
+        result = self.db.execute(
+            delete(ChatSession)
+            .where(ChatSession.id == session_id, ChatSession.user_id == user_id)
+        )
+        if result.rowcount == 0:
+            self.db.rollback()
             return False
 
-        self.db.delete(session)
         self.db.commit()
+        context_cache.invalidate_history(session_id)
 
         logger.info(f"Deleted session {session_id}")
         return True
@@ -178,18 +328,15 @@ class ChatService:
         api_key: Optional[str] = None
     ) -> Dict[str, Any]:
         """Send a message in a chat session and get LLM response."""
-        session = self.get_session(session_id, user_id)
+        session = await asyncio.to_thread(self.get_active_session, session_id, user_id)
         if not session:
-            raise ValueError(f"Session {session_id} not found")
-
-        if session.status != SessionStatus.ACTIVE.value:
-            raise ValueError(f"Session {session_id} is not active")
+            raise ValueError(f"Session {session_id} not found or not active")
 
         # Build conversation context to get system prompt
-        conversation_context = self._build_conversation_context(session)
+        conversation_context = await asyncio.to_thread(self._build_conversation_context, session)
 
         # Extract system message from context (first message with role: "system")
-        # MINIMAL format - ONLY role + content for interaction_messages
+        # MINIMAL format - ONLY role + content for chat_message
         system_message = None
         if conversation_context and conversation_context[0].get("role") == "system":
             system_message = {
@@ -197,7 +344,7 @@ class ChatService:
                 "content": conversation_context[0]["content"]
             }
 
-        # MINIMAL format - ONLY role + content for interaction_messages
+        # MINIMAL format - ONLY role + content for chat_message
         user_message = {
             "role": "user",
             "content": message_content
@@ -220,38 +367,25 @@ class ChatService:
             logger.error(f"LLM error in session {session_id}: {str(e)}")
             raise
 
-        # MINIMAL format - ONLY role + content for interaction_messages
+        # MINIMAL format - ONLY role + content for chat_message
         assistant_message = {
             "role": "assistant",
             "content": assistant_content
         }
 
-        # Save to BOTH interaction_messages (minimal format) and legacy messages column
-
-        # INTERACTION_MESSAGES (minimal: ONLY role + content)
-        interaction_to_save = []
-        if system_message and len(session.interaction_messages) == 0:
-            interaction_to_save.append(system_message)
-        interaction_to_save.append(user_message)
-        interaction_to_save.append(assistant_message)
-        session.interaction_messages.extend(interaction_to_save)
-
-        # LEGACY messages column (for backward compatibility)
-        if system_message and len(session.messages) == 0:
-            session.messages.append(system_message)
-        session.messages.append(user_message)
-        session.messages.append(assistant_message)
-
-        session.total_messages = len(session.interaction_messages)
+        # Save to chat_message (system message only with the first exchange)
+        messages_to_save = []
+        if system_message and not session.total_messages:
+            messages_to_save.append(system_message)
+        messages_to_save.append(user_message)
+        messages_to_save.append(assistant_message)
+        previous_total = await asyncio.to_thread(self._append_messages, session, messages_to_save)
 
-        from sqlalchemy.orm.attributes import flag_modified
-        flag_modified(session, "interaction_messages")
-        flag_modified(session, "messages")
+        await asyncio.to_thread(self.db.commit)
+        # Only a committed turn may extend the cached history
+        context_cache.append_history(session.id, previous_total, messages_to_save)
 
-        self.db.commit()
-        self.db.refresh(session)
-
-        logger.info(f"Session {session_id}: Message exchange completed (total: {len(session.messages)})")
+        logger.info(f"Session {session_id}: Message exchange completed (total: {session.total_messages})")
 
         return {
             "user_message": user_message,
@@ -262,16 +396,123 @@ class ChatService:
         """
         Build conversation context from session messages.
 
+        The system prompt is rendered once per session (see _render_system_prompt)
+        and cached in session.system_prompt_cached, since the prompt fields do not
+        change after the session is created. The cached value is persisted with
+        the next commit of the session.
+
+        Args:
+            session: Chat session
+            include_rag_instruction: Unused, kept for compatibility (the RAG
+                instruction is part of prompt_general)
+        """
+        context = []
+
+        if session.system_prompt_cached is None:
+            session.system_prompt_cached = self._render_system_prompt(session)
+        system_content = session.system_prompt_cached
+
+        # RAG instruction is now included in prompt_general (Teacher's Specific Prompt)
+        # No additional RAG instruction is appended here, so the
+        # include_rag_instruction config flag is not looked up per turn
+
+        if system_content:
+            context.append({
+                "role": "system",
+                "content": system_content
+            })
+
+        # Add conversation history (cached per session, see context_cache)
+        total_messages = session.total_messages or 0
+        history = context_cache.get_history(session.id, total_messages)
+        if history is None:
+            # Stream rows in batches instead of materializing the full result first
+            rows = (
+                self.db.query(ChatMessage.role, ChatMessage.content)
+                .filter(ChatMessage.session_id == session.id)
+                .order_by(ChatMessage.seq)
+                .yield_per(200)
+            )
+            history = [{"role": row.role, "content": row.content} for row in rows]
+            context_cache.set_history(session.id, total_messages, history)
+
+        context.extend(history)
+
+        return context
+
+    def _append_messages(self, session: ChatSession, messages: List[Dict[str, Any]]) -> int:
+        """
+        Append messages to the session's chat_message log (not committed).
+
+        Each message is a new row, so an exchange costs a few small INSERTs
+        instead of rewriting the whole conversation. The seqs are reserved
+        first with UPDATE ... SET total_messages = total_messages + n
+        RETURNING total_messages: the row lock it takes serializes concurrent
+        turns of the same session until commit, so each turn numbers its rows
+        from the counter as it really is, never from a stale loaded value.
+
+        Blocking (runs the UPDATE); call it from a worker thread.
+
+        Returns:
+            Message count before this append (for context_cache.append_history
+            once the turn is committed)
+        """
+        new_total = self.db.execute(
+            update(ChatSession)
+            .where(ChatSession.id == session.id)
+            .values(total_messages=func.coalesce(ChatSession.total_messages, 0) + len(messages))
+            .returning(ChatSession.total_messages)
+            .execution_options(synchronize_session=False)
+        ).scalar_one()
+        previous_total = new_total - len(messages)
+        # Reflect the new count without marking the attribute dirty (a flush
+        # would otherwise write the absolute value back)
+        set_committed_value(session, "total_messages", new_total)
+
+        self.db.add_all([
+            ChatMessage(
+                session_id=session.id,
+                seq=seq,
+                role=message["role"],
+                content=message["content"],
+                sources=message.get("sources")
+            )
+            for seq, message in enumerate(messages, start=previous_total)
+        ])
+        return previous_total
+
+    def get_session_messages(self, session_id: UUID) -> List[Dict[str, Any]]:
+        """Get all messages of a session in order (legacy messages format)."""
+        rows = (
+            self.db.query(ChatMessage.role, ChatMessage.content, ChatMessage.created_at, ChatMessage.sources)
+            .filter(ChatMessage.session_id == session_id)
+            .order_by(ChatMessage.seq)
+            .all()
+        )
+        return [
+            {
+                "role": row.role,
+                "content": row.content,
+                "created_at": row.created_at,
+                "sources": row.sources
+            }
+            for row in rows
+        ]
+
+    def _render_system_prompt(self, session: ChatSession) -> str:
+        """
+        Render the concatenated system prompt for a session.
+
         Concatenates prompt sources with structured format:
         - Student Learning Profile section (task, persona, mission_objective)
         - Teacher's Specific Prompt section (prompt_general + prompt from Prompt table)
 
         Args:
             session: Chat session
-            include_rag_instruction: Whether to add RAG instruction to system prompt (None = use database config)
-        """
-        context = []
 
+        Returns:
+            System prompt text ("" if the session has no prompt fields)
+        """
         # Build concatenated system prompt with structured format
         prompt_sections = []
 
@@ -292,72 +533,59 @@ class ChatService:
             prompt_sections.append("Student Learning Profile\n" + "\n\n".join(student_profile))
 
         # SECTION 3: Specific Prompt (from Prompt table - lowest priority/specific)
+        # (content comes from the prompt cache, see prompt_cache.get_prompt_content)
         if session.prompt_id:
-            prompt = self.db.query(Prompt).filter(Prompt.id == session.prompt_id).first()
-            if prompt:
-                prompt_sections.append(f"# Specific Prompt\n{prompt.content}")
+            prompt_content = get_prompt_content(self.db, session.prompt_id)
+            if prompt_content is not None:
+                prompt_sections.append(f"# Specific Prompt\n{prompt_content}")
 
         # Concatenate sections with double newline separator
         system_content = "\n\n".join(prompt_sections) if prompt_sections else ""
 
-        # Get RAG instruction setting from database if not explicitly provided
-        if include_rag_instruction is None:
-            try:
-                rag_service = RAGService(self.db)
-                config = rag_service.get_config()
-                include_rag_instruction = config.get("include_rag_instruction", True)
-            except Exception as e:
-                logger.warning(f"Failed to load RAG config, using default include_rag_instruction=True: {e}")
-                include_rag_instruction = True
-
-        # RAG instruction is now included in prompt_general (Teacher's Specific Prompt)
-        # No additional RAG instruction appended here
-
-        # Log the complete concatenated system prompt
-        if system_content:
-            logger.info(f"[CONTEXT] Session {session.id} - Building conversation context")
-            logger.info("=" * 100)
-            logger.info("[FINAL SYSTEM PROMPT (Concatenated)]:")
-            logger.info("-" * 100)
-            logger.info(system_content)
-            logger.info("-" * 100)
-            logger.info("=" * 100)
-
-        if system_content:
-            context.append({
-                "role": "system",
-                "content": system_content
-            })
-
-        # Add conversation history
-        for msg in session.messages:
-            context.append({
-                "role": msg["role"],
-                "content": msg["content"]
-            })
-
-        return context
-
-    def _get_model(self, model_id: str) -> Optional[Model]:
-        """Get model from database by ID or name."""
-        try:
-            uuid_obj = UUID(model_id)
-            model = self.db.query(Model).filter(Model.id == uuid_obj).first()
-            if model:
-                return model
-        except (ValueError, AttributeError):
-            pass
-
-        model = self.db.query(Model).filter(Model.name == model_id).first()
+        # Dump the complete concatenated system prompt (trace only)
+        if system_content and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[CONTEXT] Session {session.id} - Rendering system prompt")
+            logger.debug(_HR_HEAVY)
+            logger.debug("[FINAL SYSTEM PROMPT (Concatenated)]:")
+            logger.debug(_HR_LIGHT)
+            logger.debug(system_content)
+            logger.debug(_HR_LIGHT)
+            logger.debug(_HR_HEAVY)
+
+        return system_content
+
+    def _get_model(self, model_id: str) -> Optional[Row]:
+        """Get model (id, display_name) by ID or name (memoized per process)."""
+        now = time.monotonic()
+        entry = self._model_cache.get(model_id)
+        if entry is not None and now < entry[0]:
+            return entry[1]
+
+        columns = self.db.query(Model.id, Model.display_name)
+        model = None
+        # Regex pre-check instead of try/except UUID(): names skip the exception path
+        if isinstance(model_id, str) and _UUID_RE.match(model_id):
+            model = columns.filter(Model.id == UUID(model_id)).first()
+
+        if model is None:
+            model = columns.filter(Model.name == model_id).first()
+
+        if model is not None:
+            self._model_cache[model_id] = (now + MODEL_CACHE_TTL_SECONDS, model)
         return model
 
+    @classmethod
+    def invalidate_model_cache(cls) -> None:
+        """Drop all memoized _get_model lookups."""
+        cls._model_cache.clear()
+
     def get_session_context(self, session_id: UUID, user_id: UUID) -> Optional[List[Dict[str, Any]]]:
         """Get the full conversation context for a session."""
         session = self.get_session(session_id, user_id)
         if not session:
             return None
 
-        return session.messages
+        return self.get_session_messages(session.id)
 
     async def send_message_stream(
         self,
@@ -365,7 +593,8 @@ class ChatService:
         user_id: UUID,
         message_content: str,
         api_key: Optional[str] = None,
-        use_rag: bool = True
+        use_rag: bool = True,
+        session: Optional[ChatSession] = None
     ):
         """
         Send a message in a chat session and stream LLM response.
@@ -379,26 +608,27 @@ class ChatService:
             message_content: User's message content
             api_key: Optional API key for LLM provider
             use_rag: Enable RAG tool calling (default: True)
+            session: Session already loaded by the caller via get_active_session (skips the lookup)
 
         Yields:
             Dict with 'type' and 'content':
             - {'type': 'user_message', 'content': {...}}
             - {'type': 'rag_search', 'content': {...}} (only if use_rag=True)
-            - {'type': 'chunk', 'content': 'text chunk'}
+            - {'type': 'chunk', 'content': 'text chunk'} (a batch of up to
+              CHUNK_COALESCE_MAX_CHUNKS LLM chunks; same dict object reused per
+              batch, consume it before advancing the generator)
             - {'type': 'done', 'content': {...}}
 
         Raises:
             ValueError: If session not found or not active
         """
-        session = self.get_session(session_id, user_id)
+        if session is None:
+            session = await asyncio.to_thread(self.get_active_session, session_id, user_id)
         if not session:
-            raise ValueError(f"Session {session_id} not found")
-
-        if session.status != SessionStatus.ACTIVE.value:
-            raise ValueError(f"Session {session_id} is not active")
+            raise ValueError(f"Session {session_id} not found or not active")
 
         # Build conversation context to get system prompt
-        conversation_context = self._build_conversation_context(session)
+        conversation_context = await asyncio.to_thread(self._build_conversation_context, session)
 
         # Extract system message from context (first message with role: "system")
         system_message = None
@@ -408,7 +638,7 @@ class ChatService:
                 "content": conversation_context[0]["content"]
             }
 
-        # Create user message (MINIMAL format - ONLY role + content for interaction_messages)
+        # Create user message (MINIMAL format - ONLY role + content for chat_message)
         user_message = {
             "role": "user",
             "content": message_content
@@ -424,32 +654,42 @@ class ChatService:
         })
 
         logger.info(
-            f"Session {session_id}: Streaming message (rag={use_rag}, context: {len(conversation_context)} msgs)"
+            "Session %s: Streaming message (rag=%s, context: %s msgs)",
+            session_id, use_rag, len(conversation_context)
         )
 
         # Initialize variables
-        full_content = ""
-        sources_list = []
+        content_parts: List[str] = []  # Streamed text, joined once at the end
+        # Reused for every token: the consumer serializes each event before
+        # pulling the next one, so one dict is enough
+        chunk_event: Dict[str, Any] = {"type": "chunk", "content": None}
+        coalescer = _ChunkCoalescer()
+        # Unique sources keyed by (document_id, page_number), deduped as they arrive
+        sources_by_key: Dict[tuple, Dict[str, Any]] = {}
         real_messages_list = []  # Track for real_messages column (Option A: User original)
         tool_messages = []  # Track tool calls and results for real_messages
 
+        # One timestamp for everything created before the LLM call
+        turn_started_at = datetime.now(timezone.utc).isoformat()
+
         # Build real_messages (Option A: User message ORIGINAL)
         # Add system message to real_messages only if first message
-        if system_message and len(session.interaction_messages) == 0:
+        if system_message and not session.total_messages:
             real_messages_list.append({
                 "role": "system",
                 "content": system_message["content"],
-                "created_at": datetime.utcnow().isoformat()
+                "created_at": turn_started_at
             })
-            logger.debug(f"[REAL_MESSAGES] Added system message")
+            logger.debug("[REAL_MESSAGES] Added system message")
 
         # Add user message to real_messages (ORIGINAL - not refined)
         real_messages_list.append({
             "role": "user",
             "content": message_content,  # ORIGINAL user input
-            "created_at": datetime.utcnow().isoformat()
+            "created_at": turn_started_at
         })
-        logger.debug(f"[REAL_MESSAGES] Added user message (original): {message_content[:50]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[REAL_MESSAGES] Added user message (original): %s...", message_content[:50])
 
         try:
             if use_rag:
@@ -470,16 +710,31 @@ class ChatService:
                     event_type = event.get("type")
                     event_content = event.get("content")
 
-                    logger.info(f"[CHAT_SERVICE] Provider event #{provider_event_count}: type='{event_type}'")
+                    if event_type == "chunk":
+                        # Hot path (one event per token): no logging, no branch chain
+                        content_parts.append(event_content)
+                        batch = coalescer.add(event_content)
+                        if batch is not None:
+                            chunk_event["content"] = batch
+                            yield chunk_event
+                        continue
+
+                    # Release buffered text before any other event to keep ordering
+                    batch = coalescer.flush()
+                    if batch is not None:
+                        chunk_event["content"] = batch
+                        yield chunk_event
+
+                    logger.info("[CHAT_SERVICE] Provider event #%s: type='%s'", provider_event_count, event_type)
                     if event_type in ["tool_call", "refine_prompt", "refine_prompt_result", "rag_search", "rag_search_result"]:
-                        logger.info(f"[CHAT_SERVICE] IMPORTANT EVENT #{provider_event_count}: type='{event_type}', content={event_content}")
+                        logger.info("[CHAT_SERVICE] IMPORTANT EVENT #%s: type='%s', content=%s", provider_event_count, event_type, event_content)
 
                     if event_type == "tool_call":
                         # LLM is calling a tool
                         tool_name = event_content.get("tool_name")
                         tool_input = event_content.get("tool_input", {})
 
-                        logger.info(f"[TOOL_CALL] Tool '{tool_name}' called with input: {tool_input}")
+                        logger.info("[TOOL_CALL] Tool '%s' called with input: %s", tool_name, tool_input)
 
                         # IMPORTANT: Transform generic tool_call events to specific event types
                         # This is needed because some providers (OpenAI) only emit generic "tool_call" events
@@ -491,8 +746,8 @@ class ChatService:
                             else:
                                 original_prompt = str(tool_input) if tool_input else ""
 
-                            logger.info(f"[CHAT_SERVICE] TRANSFORMING tool_call → refine_prompt event")
-                            logger.info(f"[REFINE_PROMPT_EVENT] Yielding refine_prompt event with prompt: '{original_prompt}'")
+                            logger.info("[CHAT_SERVICE] TRANSFORMING tool_call → refine_prompt event")
+                            logger.info("[REFINE_PROMPT_EVENT] Yielding refine_prompt event with prompt: '%s'", original_prompt)
                             # Forward the event before tool execution (TAHAP 1)
                             event_to_yield = {
                                 "type": "refine_prompt",
@@ -501,7 +756,7 @@ class ChatService:
                                     "status": "refining"
                                 }
                             }
-                            logger.info(f"[CHAT_SERVICE] 📤 YIELDING refine_prompt event")
+                            logger.info("[CHAT_SERVICE] 📤 YIELDING refine_prompt event")
                             yield event_to_yield
                         elif tool_name == "semantic_search":
                             # Extract query from tool_input (handle different possible formats)
@@ -510,8 +765,8 @@ class ChatService:
                             else:
                                 query = str(tool_input) if tool_input else ""
 
-                            logger.info(f"[CHAT_SERVICE] TRANSFORMING tool_call → rag_search event")
-                            logger.info(f"[RAG_SEARCH_EVENT] Yielding rag_search event with query: '{query}'")
+                            logger.info("[CHAT_SERVICE] TRANSFORMING tool_call → rag_search event")
+                            logger.info("[RAG_SEARCH_EVENT] Yielding rag_search event with query: '%s'", query)
                             # Forward the event before tool execution (TAHAP 1)
                             yield {
                                 "type": "rag_search",
@@ -522,7 +777,7 @@ class ChatService:
                             }
                         else:
                             # Default for other tools
-                            logger.info(f"[CHAT_SERVICE] Generic tool_call for: {tool_name}")
+                            logger.info("[CHAT_SERVICE] Generic tool_call for: %s", tool_name)
                             yield {
                                 "type": "tool_call",
                                 "content": {
@@ -537,11 +792,11 @@ class ChatService:
                         result = event_content.get("result")
                         error = event_content.get("error")
 
-                        logger.info(f"[CHAT_SERVICE] 📥 Received refine_prompt_result from provider")
-                        logger.info(f"[CHAT_SERVICE] Result: {result}, Error: {error}")
+                        logger.info("[CHAT_SERVICE] 📥 Received refine_prompt_result from provider")
+                        logger.info("[CHAT_SERVICE] Result: %s, Error: %s", result, error)
 
                         if error:
-                            logger.warning(f"[REFINE_PROMPT_RESULT] Tool {tool_name} error: {error}")
+                            logger.warning("[REFINE_PROMPT_RESULT] Tool %s error: %s", tool_name, error)
                             event_to_yield = {
                                 "type": "refine_prompt_result",
                                 "content": {
@@ -556,12 +811,12 @@ class ChatService:
                                 original = result.get("original", "")
                                 refined = result.get("refined", "")
                                 success = result.get("success", True)
-                                logger.info(f"[REFINE_PROMPT_RESULT] '{original}' → '{refined}'")
+                                logger.info("[REFINE_PROMPT_RESULT] '%s' → '%s'", original, refined)
                             else:
                                 original = str(result)
                                 refined = str(result)
                                 success = True
-                                logger.warning(f"[REFINE_PROMPT_RESULT] Result is not dict: {result}")
+                                logger.warning("[REFINE_PROMPT_RESULT] Result is not dict: %s", result)
 
                             event_to_yield = {
                                 "type": "refine_prompt_result",
@@ -573,18 +828,18 @@ class ChatService:
                             }
 
                             # Add to real_messages (Option A)
+                            tool_result_at = datetime.now(timezone.utc).isoformat()
                             # First add the tool_call message
                             if not any(msg.get("role") == "assistant" and msg.get("tool_calls") for msg in real_messages_list):
                                 # Add assistant message with tool_calls if not already there
                                 real_messages_list.append({
                                     "role": "assistant",
                                     "content": "",
-                                    "created_at": datetime.utcnow().isoformat(),
+                                    "created_at": tool_result_at,
                                     "tool_calls": [{"name": tool_name, "args": {"original_prompt": original}}]
                                 })
 
                             # Then add tool message with result
-                            import json
                             real_messages_list.append({
                                 "role": "tool",
                                 "content": json.dumps({
@@ -592,12 +847,12 @@ class ChatService:
                                     "refined": refined,
                                     "success": success
                                 }, ensure_ascii=False),
-                                "created_at": datetime.utcnow().isoformat(),
+                                "created_at": tool_result_at,
                                 "tool_call_id": f"tool_call_{tool_name}"
                             })
-                            logger.debug(f"[REAL_MESSAGES] Added tool message for {tool_name}")
+                            logger.debug("[REAL_MESSAGES] Added tool message for %s", tool_name)
 
-                        logger.info(f"[CHAT_SERVICE] 📤 YIELDING refine_prompt_result event")
+                        logger.info("[CHAT_SERVICE] 📤 YIELDING refine_prompt_result event")
                         yield event_to_yield
 
                     elif event_type == "rag_search_result":
@@ -606,36 +861,37 @@ class ChatService:
                         result = event_content.get("result")
                         error = event_content.get("error")
 
-                        logger.info(f"[CHAT_SERVICE] 📥 Received rag_search_result from provider")
-                        logger.info(f"[CHAT_SERVICE] Tool: {tool_name}, Error: {error}")
-                        logger.info(f"[CHAT_SERVICE] Full result object: {result}")
-                        logger.info(f"[CHAT_SERVICE] Result type: {type(result)}, Result keys: {result.keys() if isinstance(result, dict) else 'N/A'}")
+                        logger.info("[CHAT_SERVICE] 📥 Received rag_search_result from provider")
+                        logger.info("[CHAT_SERVICE] Tool: %s, Error: %s", tool_name, error)
+                        logger.info("[CHAT_SERVICE] Full result object: %s", result)
+                        if logger.isEnabledFor(logging.INFO):
+                            logger.info("[CHAT_SERVICE] Result type: %s, Result keys: %s", type(result), result.keys() if isinstance(result, dict) else 'N/A')
 
                         if error:
-                            logger.warning(f"Tool {tool_name} error: {error}")
+                            logger.warning("Tool %s error: %s", tool_name, error)
                         else:
                             results_count = result.get('count', 0) if isinstance(result, dict) else 0
-                            logger.info(f"[CHAT_SERVICE] Tool {tool_name} returned {results_count} results")
+                            logger.info("[CHAT_SERVICE] Tool %s returned %s results", tool_name, results_count)
 
                             # Extract sources from tool result
                             if isinstance(result, dict):
                                 tool_sources = result.get("sources", [])
-                                logger.info(f"[CHAT_SERVICE] Extracted {len(tool_sources)} sources from tool result")
-                                logger.info(f"[CHAT_SERVICE] Tool sources: {tool_sources}")
-                                sources_list.extend(tool_sources)
+                                logger.info("[CHAT_SERVICE] Extracted %s sources from tool result", len(tool_sources))
+                                logger.info("[CHAT_SERVICE] Tool sources: %s", tool_sources)
+                                self._collect_sources(sources_by_key, tool_sources)
 
                                 # Add to real_messages (Option A) - CHUNKS ARE HERE!
-                                import json
+                                tool_result_at = datetime.now(timezone.utc).isoformat()
 
                                 # First add the tool_call message for semantic_search
                                 search_query = result.get("query", "")
                                 real_messages_list.append({
                                     "role": "assistant",
                                     "content": "",
-                                    "created_at": datetime.utcnow().isoformat(),
+                                    "created_at": tool_result_at,
                                     "tool_calls": [{"name": tool_name, "args": {"query": search_query}}]
                                 })
-                                logger.debug(f"[REAL_MESSAGES] Added tool_call for {tool_name}")
+                                logger.debug("[REAL_MESSAGES] Added tool_call for %s", tool_name)
 
                                 # Prepare chunks data - normalize structure
                                 # Provider might return "results" or "chunks" field, standardize to "chunks"
@@ -653,10 +909,10 @@ class ChatService:
                                 real_messages_list.append({
                                     "role": "tool",
                                     "content": json.dumps(standardized_result, ensure_ascii=False, indent=2),  # FULL result dengan chunks
-                                    "created_at": datetime.utcnow().isoformat(),
+                                    "created_at": tool_result_at,
                                     "tool_call_id": f"tool_call_{tool_name}"
                                 })
-                                logger.info(f"[REAL_MESSAGES] Added ToolMessage with {results_count} chunks (CHUNKS PRESERVED HERE!)")
+                                logger.info("[REAL_MESSAGES] Added ToolMessage with %s chunks (CHUNKS PRESERVED HERE!)", results_count)
 
                                 event_to_yield = {
                                     "type": "rag_search",
@@ -666,7 +922,7 @@ class ChatService:
                                         "status": "completed"
                                     }
                                 }
-                                logger.info(f"[CHAT_SERVICE] 📤 YIELDING rag_search completion event")
+                                logger.info("[CHAT_SERVICE] 📤 YIELDING rag_search completion event")
                                 yield event_to_yield
 
                     elif event_type == "tool_result":
@@ -675,27 +931,21 @@ class ChatService:
                         result = event_content.get("result")
                         error = event_content.get("error")
 
-                        logger.info(f"[CHAT_SERVICE] 📥 Received tool_result event (fallback)")
-                        logger.info(f"[CHAT_SERVICE] Tool: {tool_name}, Error: {error}")
-                        logger.info(f"[CHAT_SERVICE] Result: {result}")
+                        logger.info("[CHAT_SERVICE] 📥 Received tool_result event (fallback)")
+                        logger.info("[CHAT_SERVICE] Tool: %s, Error: %s", tool_name, error)
+                        logger.info("[CHAT_SERVICE] Result: %s", result)
 
                         if error:
-                            logger.warning(f"Tool {tool_name} error: {error}")
+                            logger.warning("Tool %s error: %s", tool_name, error)
                         else:
-                            logger.debug(f"Tool {tool_name} executed successfully")
+                            logger.debug("Tool %s executed successfully", tool_name)
 
                             # Also extract sources for semantic_search tool in tool_result event
                             if tool_name == "semantic_search" and isinstance(result, dict):
                                 tool_sources = result.get("sources", [])
-                                logger.info(f"[CHAT_SERVICE] 📌 TOOL_RESULT: Extracted {len(tool_sources)} sources from semantic_search")
-                                logger.info(f"[CHAT_SERVICE] Sources: {tool_sources}")
-                                sources_list.extend(tool_sources)
-
-                    elif event_type == "chunk":
-                        # Streaming text response from LLM
-                        chunk_content = event_content
-                        full_content += chunk_content
-                        yield {"type": "chunk", "content": chunk_content}
+                                logger.info("[CHAT_SERVICE] 📌 TOOL_RESULT: Extracted %s sources from semantic_search", len(tool_sources))
+                                logger.info("[CHAT_SERVICE] Sources: %s", tool_sources)
+                                self._collect_sources(sources_by_key, tool_sources)
 
             else:
                 # --- Regular Mode: No RAG ---
@@ -704,33 +954,28 @@ class ChatService:
                     messages=conversation_context,
                     api_key=api_key
                 ):
-                    full_content += chunk
-                    yield {"type": "chunk", "content": chunk}
+                    content_parts.append(chunk)
+                    batch = coalescer.add(chunk)
+                    if batch is not None:
+                        chunk_event["content"] = batch
+                        yield chunk_event
+
+            # Release whatever text is still buffered
+            batch = coalescer.flush()
+            if batch is not None:
+                chunk_event["content"] = batch
+                yield chunk_event
 
         except Exception as e:
-            logger.error(f"LLM error in session {session_id}: {str(e)}")
+            logger.error("LLM error in session %s: %s", session_id, e)
             raise
 
-        # Remove duplicate sources (by document_id and page) and normalize field names
-        unique_sources = []
-        if use_rag and sources_list:
-            seen = set()
-            for source in sources_list:
-                # Normalize field names for consistency with frontend
-                # RAG service returns: document_id, filename, page, similarity_score
-                # Frontend expects: document_id, document_name, page_number, similarity_score
-                normalized = {
-                    "document_id": source.get("document_id", ""),
-                    "document_name": source.get("filename") or source.get("document_name", "Document"),  # Support both field names
-                    "page_number": source.get("page") or source.get("page_number", 1),  # Support both field names
-                    "similarity_score": source.get("similarity_score", 0.85)
-                }
-                key = (normalized["document_id"], normalized["page_number"])
-                if key not in seen:
-                    unique_sources.append(normalized)
-                    seen.add(key)
+        full_content = "".join(content_parts)
+
+        # Sources were deduped on arrival; dict order keeps first-seen order
+        unique_sources = list(sources_by_key.values())
 
-        # Create assistant message (MINIMAL format - ONLY role + content for interaction_messages)
+        # Create assistant message (MINIMAL format - ONLY role + content for chat_message)
         assistant_message = {
             "role": "assistant",
             "content": full_content
@@ -740,58 +985,57 @@ class ChatService:
         real_messages_list.append({
             "role": "assistant",
             "content": full_content,
-            "created_at": datetime.utcnow().isoformat(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
             "sources": unique_sources if unique_sources else None
         })
-        logger.debug(f"[REAL_MESSAGES] Added final assistant message")
+        logger.debug("[REAL_MESSAGES] Added final assistant message")
 
-        # Save messages to database (populate BOTH columns)
+        # Save messages to database
         # NOTE:
-        # - interaction_messages: Simple format (system, user, assistant) - for display
+        # - chat_message rows: Simple format (system, user, assistant) - for display
         # - real_messages: Full format (with tool messages for Option A) - for exact replay
-        # - messages: Legacy column (for backward compatibility)
 
-        # INTERACTION_MESSAGES (Simple format for display)
-        interaction_messages_to_save = []
+        # CHAT_MESSAGE (Simple format for display, append-only)
+        messages_to_save = []
 
         # Add system message only if it's the first message
-        if system_message and len(session.interaction_messages) == 0:
-            interaction_messages_to_save.append(system_message)
+        if system_message and not session.total_messages:
+            messages_to_save.append(system_message)
 
-        interaction_messages_to_save.append(user_message)
-        interaction_messages_to_save.append(assistant_message)
+        messages_to_save.append(user_message)
+        messages_to_save.append({**assistant_message, "sources": unique_sources or None})
 
-        # Append to interaction_messages
-        session.interaction_messages.extend(interaction_messages_to_save)
-        logger.info(f"[INTERACTION_MESSAGES] Saved {len(interaction_messages_to_save)} messages")
+        previous_total = await asyncio.to_thread(self._append_messages, session, messages_to_save)
+        logger.info("[CHAT_MESSAGE] Saved %s messages", len(messages_to_save))
 
         # REAL_MESSAGES (Full format with tools for Option A)
-        session.real_messages.extend(real_messages_list)
-        logger.info(f"[REAL_MESSAGES] Saved {len(real_messages_list)} messages (chunks preserved in ToolMessages)")
-
-        # LEGACY: Keep messages column for backward compatibility
-        if system_message and len(session.messages) == 0:
-            session.messages.append(system_message)
-
-        session.messages.append(user_message)
-        session.messages.append(assistant_message)
-
-        # Update total messages and flag modified
-        session.total_messages = len(session.interaction_messages)
-
-        from sqlalchemy.orm.attributes import flag_modified
-        flag_modified(session, "interaction_messages")
-        flag_modified(session, "real_messages")
-        flag_modified(session, "messages")
+        # Appended in SQL (real_messages || new items) so the existing array is
+        # never loaded into Python (it is deferred by get_session_for_turn)
+        await asyncio.to_thread(
+            self.db.execute,
+            update(ChatSession)
+            .where(ChatSession.id == session.id)
+            .values(
+                real_messages=ChatSession.real_messages.op("||")(
+                    bindparam("new_real_messages", real_messages_list, type_=JSONB)
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+        logger.info("[REAL_MESSAGES] Saved %s messages (chunks preserved in ToolMessages)", len(real_messages_list))
 
-        self.db.commit()
-        self.db.refresh(session)
+        # One commit for the whole turn (chat_message rows, total_messages,
+        # real_messages, system_prompt_cached). It deliberately happens before
+        # `done` is yielded: clients close the stream on `done`, and a
+        # disconnect cancels this generator, so persisting afterwards could
+        # silently drop the turn.
+        await asyncio.to_thread(self.db.commit)
+        # Only a committed turn may extend the cached history
+        context_cache.append_history(session.id, previous_total, messages_to_save)
 
         logger.info(
-            f"Session {session_id}: Streaming completed"
-            f" | interaction_messages: {len(session.interaction_messages)}"
-            f" | real_messages: {len(session.real_messages)}"
-            f" | sources: {len(unique_sources)}"
+            "Session %s: Streaming completed | messages: %s | real_messages: +%s | sources: %s",
+            session_id, session.total_messages, len(real_messages_list), len(unique_sources)
         )
 
         # Yield done signal with assistant message and sources
@@ -801,9 +1045,29 @@ class ChatService:
             "sources": unique_sources if unique_sources else [],  # Include sources in done event
             "tool_calls": []  # For future tool call support
         }
-        logger.info(f"[CHAT_SERVICE] 📤 YIELDING done event with {len(unique_sources)} sources")
+        logger.info("[CHAT_SERVICE] 📤 YIELDING done event with %s sources", len(unique_sources))
         yield done_payload
 
+    @staticmethod
+    def _collect_sources(sources_by_key: Dict[tuple, Dict[str, Any]], sources: List[Dict[str, Any]]) -> None:
+        """Normalize sources and add the ones not seen yet (by document_id and page)."""
+        for source in sources:
+            document_id = source.get("document_id", "")
+            page_number = source.get("page") or source.get("page_number", 1)  # Support both field names
+            key = (document_id, page_number)
+            if key in sources_by_key:
+                continue  # Seen already: skip building the normalized dict
+
+            # Normalize field names for consistency with frontend
+            # RAG service returns: document_id, filename, page, similarity_score
+            # Frontend expects: document_id, document_name, page_number, similarity_score
+            sources_by_key[key] = {
+                "document_id": document_id,
+                "document_name": source.get("filename") or source.get("document_name", "Document"),  # Support both field names
+                "page_number": page_number,
+                "similarity_score": source.get("similarity_score", 0.85)
+            }
+
     async def analyze_session(
         self,
         session_id: UUID,
@@ -822,22 +1086,25 @@ class ChatService:
         Returns:
             Dict with analysis results or None if session not found
         """
-        session = self.get_session(session_id, user_id)
+        session = await asyncio.to_thread(self.get_session_for_turn, session_id, user_id)
         if not session:
             return None
 
-        if not session.messages:
+        messages = await asyncio.to_thread(self.get_session_messages, session.id)
+        if not messages:
             raise ValueError(f"Session {session_id} has no messages to analyze")
 
         try:
             # Get analysis prompt from ChatConfig
-            chat_config = self.db.query(ChatConfig).filter(ChatConfig.id == 1).first()
+            chat_config = await asyncio.to_thread(
+                lambda: self.db.query(ChatConfig).filter(ChatConfig.id == 1).first()
+            )
             if not chat_config or not chat_config.prompt_analysis:
                 raise ValueError("Analysis prompt not configured in ChatConfig")
 
             # Build analysis context
             # Convert messages to readable format
-            messages_text = self._format_messages_for_analysis(session.messages)
+            messages_text = self._format_messages_for_analysis(messages)
 
             # Prepare analysis prompt with conversation history
             analysis_context = [
@@ -862,8 +1129,7 @@ class ChatService:
             logger.info(f"[ANALYSIS] Session {session_id}: Raw LLM response received")
 
             # Parse LLM response as JSON
-            import json
-            analysis_data = json.loads(analysis_json)
+            analysis_data = orjson.loads(analysis_json)
 
             # Extract summary and comprehension_level from LLM response
             summary = analysis_data.get("summary", "").strip()
@@ -890,11 +1156,11 @@ class ChatService:
             # Store comprehension_level as lowercase string ("low", "medium", "high")
             session.comprehension_level = comprehension_level_raw
             session.status = "analyzed"  # Update status to analyzed
-            session.ended_at = datetime.utcnow()
-            session.analyzed_at = datetime.utcnow()
+            analyzed_at = datetime.now(timezone.utc)
+            session.ended_at = analyzed_at
+            session.analyzed_at = analyzed_at
 
-            self.db.commit()
-            self.db.refresh(session)
+            await asyncio.to_thread(self.db.commit)
 
             logger.info(f"[ANALYSIS] Session {session_id}: Analysis completed - Level: {comprehension_level_raw}")
 
@@ -902,10 +1168,10 @@ class ChatService:
                 "session_id": session.id,
                 "summary": summary,
                 "comprehension_level": comprehension_level_raw.upper(),
-                "analyzed_at": datetime.utcnow().isoformat()
+                "analyzed_at": analyzed_at.isoformat()
             }
 
-        except json.JSONDecodeError as e:
+        except (orjson.JSONDecodeError, json.JSONDecodeError) as e:
             logger.error(f"[ANALYSIS] Session {session_id}: Failed to parse LLM response as JSON: {str(e)}")
             raise ValueError("LLM response could not be parsed as JSON")
         except Exception as e:
@@ -917,20 +1183,22 @@ class ChatService:
         Format messages array into readable text for analysis.
 
         Args:
-            messages: List of message dicts from session.messages
+            messages: List of message dicts from get_session_messages
 
         Returns:
             Formatted text representation of conversation
         """
-        formatted = []
-
-        for msg in messages:
-            role = msg.get("role", "unknown").upper()
-            content = msg.get("content", "")
-
-            if role == "SYSTEM":
-                continue  # Skip system messages in formatted output
+        # System messages are skipped in the formatted output
+        return "\n\n".join(
+            f"{msg.get('role', 'unknown').upper()}: {msg.get('content', '')}"
+            for msg in messages
+            if msg.get("role") not in _ANALYSIS_SKIP_ROLES
+        )
 
-            formatted.append(f"{role}: {content}")
 
-        return "\n\n".join(formatted)
+@event.listens_for(Model, "after_insert")
+@event.listens_for(Model, "after_update")
+@event.listens_for(Model, "after_delete")
+def _on_model_write(mapper, connection, target) -> None:
+    """Invalidate the model lookup memo whenever a Model row is written."""
+    ChatService.invalidate_model_cache()
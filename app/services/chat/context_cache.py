@@ -0,0 +1,84 @@
+"""
+Conversation History Cache
+
+Process-level LRU cache of each chat session's prepared history
+([{"role", "content"}, ...]) so a new turn doesn't re-read and re-build the
+whole conversation from chat_message.
+
+Validity:
+- Each entry remembers the message count it was built at. chat_message is
+  append-only and chat_session.total_messages is the next seq, so an entry
+  is current exactly when its count equals session.total_messages.
+- A turn handled by another worker (or a rolled-back commit) leaves the
+  counts mismatched and the next read simply rebuilds from the database.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+# Maximum number of sessions kept in memory (least recently used evicted)
+MAX_CACHED_SESSIONS = 1024
+
+# session_id -> (message count, history)
+_history: "OrderedDict[UUID, Tuple[int, List[Dict[str, str]]]]" = OrderedDict()
+# ChatService reads the cache from worker threads (asyncio.to_thread)
+_lock = threading.Lock()
+
+
+def get_history(session_id: UUID, total_messages: int) -> Optional[List[Dict[str, str]]]:
+    """
+    Get the cached history of a session if it is still current.
+
+    Args:
+        session_id: Chat session ID
+        total_messages: Current chat_session.total_messages
+
+    Returns:
+        Cached history (do not mutate), or None on miss / stale entry
+    """
+    with _lock:
+        entry = _history.get(session_id)
+        if entry is None or entry[0] != total_messages:
+            return None
+        _history.move_to_end(session_id)
+        return entry[1]
+
+
+def set_history(session_id: UUID, total_messages: int, history: List[Dict[str, str]]) -> None:
+    """Store the history of a session as built at total_messages."""
+    with _lock:
+        _history[session_id] = (total_messages, history)
+        _history.move_to_end(session_id)
+        while len(_history) > MAX_CACHED_SESSIONS:
+            _history.popitem(last=False)
+
+
+def append_history(
+    session_id: UUID,
+    previous_total: int,
+    messages: List[Dict[str, str]]
+) -> None:
+    """
+    Extend a cached history with newly saved messages.
+
+    Only applies when the entry was current at previous_total; otherwise the
+    entry is dropped and rebuilt on the next read.
+    """
+    with _lock:
+        entry = _history.get(session_id)
+        if entry is None:
+            return
+        if entry[0] != previous_total:
+            del _history[session_id]
+            return
+        history = entry[1]
+        history.extend({"role": msg["role"], "content": msg["content"]} for msg in messages)
+        _history[session_id] = (previous_total + len(messages), history)
+
+
+def invalidate_history(session_id: UUID) -> None:
+    """Drop the cached history of a session."""
+    with _lock:
+        _history.pop(session_id, None)
@@ -0,0 +1,121 @@
+"""
+Prompt Cache
+
+Process-level TTL caches for Prompt lookups on the chat path:
+- the ID of the currently active Prompt (used by new chat sessions)
+- Prompt content by ID (LRU, used to verify / render session prompts)
+
+Prompts only change on admin actions, so these lookups can be served from
+memory instead of querying the prompt table every time.
+
+Invalidation:
+- SQLAlchemy mapper events on Prompt (insert/update/delete) clear the cache
+  in the process that made the change.
+- The TTL bounds staleness for other worker processes.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+from uuid import UUID
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.prompt import Prompt
+
+# How long a cached lookup stays valid (seconds)
+ACTIVE_PROMPT_TTL_SECONDS = 300
+
+# How long cached prompt content stays valid (seconds) and how many prompts to keep
+PROMPT_CONTENT_TTL_SECONDS = 300
+PROMPT_CONTENT_MAX_ENTRIES = 512
+
+_active_prompt_id: Optional[UUID] = None
+_expires_at: float = 0.0
+
+# prompt_id -> (expires_at, content)
+_prompt_content: "OrderedDict[UUID, Tuple[float, str]]" = OrderedDict()
+# ChatService reads the content cache from worker threads (asyncio.to_thread)
+_prompt_content_lock = threading.Lock()
+
+
+def get_active_prompt_id(db: Session) -> Optional[UUID]:
+    """
+    Get the ID of the active prompt, using the cache when still fresh.
+
+    Args:
+        db: Database session (only used on cache miss)
+
+    Returns:
+        Active prompt UUID, or None if no prompt is active
+    """
+    global _active_prompt_id, _expires_at
+
+    now = time.monotonic()
+    if now < _expires_at:
+        return _active_prompt_id
+
+    # Cache miss: select only the id column, no ORM object hydration
+    row = db.query(Prompt.id).filter(Prompt.is_active == True).first()
+    _active_prompt_id = row.id if row else None
+    _expires_at = now + ACTIVE_PROMPT_TTL_SECONDS
+    return _active_prompt_id
+
+
+def invalidate_active_prompt() -> None:
+    """Drop the cached active prompt ID (next lookup hits the database)."""
+    global _active_prompt_id, _expires_at
+    _active_prompt_id = None
+    _expires_at = 0.0
+
+
+def get_prompt_content(db: Session, prompt_id: UUID) -> Optional[str]:
+    """
+    Get the content of a prompt, using the cache when still fresh.
+
+    Args:
+        db: Database session (only used on cache miss)
+        prompt_id: Prompt UUID
+
+    Returns:
+        Prompt content, or None if the prompt does not exist (misses are not cached)
+    """
+    now = time.monotonic()
+    with _prompt_content_lock:
+        entry = _prompt_content.get(prompt_id)
+        if entry is not None and now < entry[0]:
+            _prompt_content.move_to_end(prompt_id)
+            return entry[1]
+
+    # Cache miss: select only the content column
+    row = db.query(Prompt.content).filter(Prompt.id == prompt_id).first()
+
+    with _prompt_content_lock:
+        if row is None:
+            _prompt_content.pop(prompt_id, None)
+            return None
+
+        _prompt_content[prompt_id] = (now + PROMPT_CONTENT_TTL_SECONDS, row.content)
+        _prompt_content.move_to_end(prompt_id)
+        while len(_prompt_content) > PROMPT_CONTENT_MAX_ENTRIES:
+            _prompt_content.popitem(last=False)
+    return row.content
+
+
+def invalidate_prompt(prompt_id: Optional[UUID] = None) -> None:
+    """Drop the cached content of one prompt (or of all prompts if no ID is given)."""
+    with _prompt_content_lock:
+        if prompt_id is None:
+            _prompt_content.clear()
+        else:
+            _prompt_content.pop(prompt_id, None)
+
+
+@event.listens_for(Prompt, "after_insert")
+@event.listens_for(Prompt, "after_update")
+@event.listens_for(Prompt, "after_delete")
+def _on_prompt_write(mapper, connection, target) -> None:
+    """Invalidate the caches whenever a Prompt row is written."""
+    invalidate_active_prompt()
+    invalidate_prompt(target.id)
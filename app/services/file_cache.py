@@ -0,0 +1,104 @@
+"""
+File Content Cache
+
+Process-level caches for serving stored files:
+- LRU cache of recently read file contents, so repeated reads of the same
+  PDF (document QA, re-processing) are served from memory instead of
+  downloading it from storage again
+- TTL cache of each document's storage reference (filename,
+  original_filename, file_size), so a read doesn't need a document query
+
+Contents are bounded both by entry count and by total bytes; the least
+recently used entries are evicted first. Stored files and these document
+columns never change after upload, so entries are dropped when a file is
+deleted; the reference TTL bounds staleness for other worker processes.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+# Maximum number of cached files and total cached bytes
+MAX_CACHED_FILES = 256
+MAX_CACHED_BYTES = 512 * 1024 * 1024  # 512MB
+
+# Files larger than this are never cached (would evict most of the cache)
+MAX_CACHED_FILE_SIZE = 64 * 1024 * 1024  # 64MB
+
+# How long a cached document reference stays valid (seconds) and how many to keep
+REFERENCE_TTL_SECONDS = 60
+MAX_CACHED_REFERENCES = 4096
+
+# file reference -> content
+_contents: "OrderedDict[str, bytes]" = OrderedDict()
+_total_bytes = 0
+# document id -> (expires_at, (filename, original_filename, file_size))
+_references: "OrderedDict[str, Tuple[float, Tuple[str, str, Optional[int]]]]" = OrderedDict()
+# FileService runs in worker threads (sync endpoints, asyncio.to_thread)
+_lock = threading.Lock()
+
+
+def get_content(file_reference: str) -> Optional[bytes]:
+    """Get the cached content of a file, or None on miss."""
+    with _lock:
+        content = _contents.get(file_reference)
+        if content is not None:
+            _contents.move_to_end(file_reference)
+        return content
+
+
+def set_content(file_reference: str, content: bytes) -> None:
+    """Store the content of a file, evicting least recently used entries over budget."""
+    global _total_bytes
+    if len(content) > MAX_CACHED_FILE_SIZE:
+        return
+
+    with _lock:
+        previous = _contents.pop(file_reference, None)
+        if previous is not None:
+            _total_bytes -= len(previous)
+
+        _contents[file_reference] = content
+        _total_bytes += len(content)
+        while len(_contents) > MAX_CACHED_FILES or _total_bytes > MAX_CACHED_BYTES:
+            _, evicted = _contents.popitem(last=False)
+            _total_bytes -= len(evicted)
+
+
+def invalidate_content(file_reference: str) -> None:
+    """Drop the cached content of a file."""
+    global _total_bytes
+    with _lock:
+        content = _contents.pop(file_reference, None)
+        if content is not None:
+            _total_bytes -= len(content)
+
+
+def get_reference(document_id: str) -> Optional[Tuple[str, str, Optional[int]]]:
+    """Get the cached (filename, original_filename, file_size) of a document, or None on miss."""
+    now = time.monotonic()
+    with _lock:
+        entry = _references.get(document_id)
+        if entry is None or now >= entry[0]:
+            return None
+        _references.move_to_end(document_id)
+        return entry[1]
+
+
+def set_reference(document_id: str, filename: str, original_filename: str, file_size: Optional[int]) -> None:
+    """Store the storage reference of a document."""
+    with _lock:
+        _references[document_id] = (
+            time.monotonic() + REFERENCE_TTL_SECONDS,
+            (filename, original_filename, file_size)
+        )
+        _references.move_to_end(document_id)
+        while len(_references) > MAX_CACHED_REFERENCES:
+            _references.popitem(last=False)
+
+
+def invalidate_reference(document_id: str) -> None:
+    """Drop the cached storage reference of a document."""
+    with _lock:
+        _references.pop(document_id, None)
@@ -7,30 +7,143 @@ Can be extended to support other cloud storage services (S3, Azure, etc.).
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import asyncio
+import hashlib
+import io
 import os
+import random
 import shutil
-from datetime import datetime
+import time
+from datetime import datetime, timedelta, timezone
+from typing import BinaryIO, List, Optional, Tuple
+from uuid import UUID, uuid4
+from sqlalchemy import delete, func, select, tuple_
 from sqlalchemy.orm import Session
 from app.models.document import Document, DocumentStatus
+from app.core.config import settings
 from app.core.logging import get_logger
+from app.services import file_cache
+from google.api_core.exceptions import (
+    BadGateway,
+    GatewayTimeout,
+    InternalServerError,
+    NotFound,
+    RequestRangeNotSatisfiable,
+    ServiceUnavailable,
+    TooManyRequests,
+)
 from google.cloud import storage as gcs_storage
 from google.oauth2 import service_account
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout as RequestsTimeout
+from urllib3.util.retry import Retry
 
 logger = get_logger(__name__)
 
+# Buffer size for copying upload streams to storage
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+# GCS upload chunk sizes by content length (multiples of 256KB); files below
+# the first threshold go up in a single request instead of a resumable session
+GCS_UPLOAD_CHUNK_SIZES = (
+    (8 * 1024 * 1024, None),                 # < 8MB: single-request upload
+    (64 * 1024 * 1024, 8 * 1024 * 1024),     # < 64MB: 8MB chunks
+    (256 * 1024 * 1024, 32 * 1024 * 1024),   # < 256MB: 32MB chunks
+)
+GCS_MAX_UPLOAD_CHUNK_SIZE = 128 * 1024 * 1024  # 128MB
+# Content type of every stored file
+_PDF_CT = 'application/pdf'
+# HTTP connection pool size of the shared GCS client (urllib3 default is 10)
+GCS_HTTP_POOL_SIZE = 64
+# GCS upload attempts and exponential backoff bounds between them (seconds)
+GCS_UPLOAD_MAX_ATTEMPTS = 3
+GCS_RETRY_BASE_DELAY = 0.2
+GCS_RETRY_MAX_DELAY = 10.0
+# Failures worth retrying an upload for (throttling, server errors, network)
+_TRANSIENT_GCS_ERRORS = (
+    TooManyRequests,
+    InternalServerError,
+    BadGateway,
+    ServiceUnavailable,
+    GatewayTimeout,
+    RequestsConnectionError,
+    RequestsTimeout,
+)
+# UPLOADING documents older than this are treated as failed uploads and swept
+STALE_UPLOAD_MINUTES = 30
+STALE_UPLOAD_SWEEP_INTERVAL_SECONDS = 600
+# Concurrent storage uploads in FileService.create_files_bulk (process-wide)
+BULK_UPLOAD_WORKERS = 32
+# GCS reads of files at least this large are split into parallel ranged GETs
+GCS_PARALLEL_DOWNLOAD_THRESHOLD = 16 * 1024 * 1024  # 16MB
+GCS_DOWNLOAD_RANGE_SIZE = 8 * 1024 * 1024  # 8MB per ranged GET
+GCS_DOWNLOAD_WORKERS = 8
+# Storage deletes of FileService.delete_file, run after the row is committed
+STORAGE_DELETE_WORKERS = 4
+
+
+def _pick_gcs_chunk_size(size: int) -> Optional[int]:
+    """Pick the GCS upload chunk size for a file of the given size (None = single request)"""
+    for limit, chunk_size in GCS_UPLOAD_CHUNK_SIZES:
+        if size < limit:
+            return chunk_size
+    return GCS_MAX_UPLOAD_CHUNK_SIZE
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter for the given (0-based) retry attempt"""
+    return random.uniform(0, min(GCS_RETRY_MAX_DELAY, GCS_RETRY_BASE_DELAY * (2 ** attempt)))
+
+
+def _sha256_of(stream: BinaryIO) -> str:
+    """Hex SHA-256 of a stream's remaining content; the stream is rewound afterwards"""
+    start_position = stream.tell()
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: stream.read(UPLOAD_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    stream.seek(start_position)
+    return digest.hexdigest()
+
+
+# Columns loaded for file listings (what FileDetailResponse renders); skips
+# the extracted text in Document.content and ORM object construction
+LIST_COLUMNS = (
+    Document.id,
+    Document.filename,
+    Document.original_filename,
+    Document.file_size,
+    Document.mime_type,
+    Document.status,
+    Document.uploaded_at,
+    Document.processed_at,
+)
+
+
+# Storage calls are blocking network/disk I/O; bulk uploads fan out on this pool
+_upload_executor = ThreadPoolExecutor(max_workers=BULK_UPLOAD_WORKERS, thread_name_prefix="file-upload")
+# Ranged GETs of parallel GCS downloads (separate pool, so a get() running on
+# the upload pool can never wait on its own workers)
+_download_executor = ThreadPoolExecutor(max_workers=GCS_DOWNLOAD_WORKERS, thread_name_prefix="file-download")
+# Storage deletes of delete_file (own pool, so they never queue behind uploads)
+_delete_executor = ThreadPoolExecutor(max_workers=STORAGE_DELETE_WORKERS, thread_name_prefix="file-delete")
+
 
 class FileStorageProvider(ABC):
     """Abstract base class for file storage providers"""
 
     @abstractmethod
-    def save(self, file_id: str, content: bytes) -> str:
+    def save(self, file_id: str, stream: BinaryIO, size: int) -> str:
         """
         Save file content and return file path/reference.
 
+        The content is read from the stream in chunks, so the whole file is
+        never held in memory.
+
         Args:
             file_id: Unique identifier for the file
-            content: File content as bytes
+            stream: Readable binary file object positioned at the start of the content
+            size: Content size in bytes
 
         Returns:
             File path or reference (for later retrieval)
@@ -38,12 +151,13 @@ class FileStorageProvider(ABC):
         pass
 
     @abstractmethod
-    def get(self, file_id: str) -> bytes:
+    def get(self, file_id: str, size: Optional[int] = None) -> bytes:
         """
         Retrieve file content by file_id.
 
         Args:
             file_id: Unique identifier for the file
+            size: Known file size in bytes, if any (lets providers plan the download)
 
         Returns:
             File content as bytes
@@ -79,14 +193,32 @@ class FileStorageProvider(ABC):
         """
         pass
 
+    def get_local_path(self, file_id: str) -> Optional[str]:
+        """
+        Get the path of the file on the local filesystem, if the provider has one.
+
+        Lets the download endpoint hand the file to the server as-is
+        (FileResponse) instead of streaming it through a Python generator.
+
+        Args:
+            file_id: Unique identifier for the file
+
+        Returns:
+            File path, or None for providers without local files
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+        """
+        return None
+
     @abstractmethod
-    def stream(self, file_id: str, chunk_size: int = 1024 * 1024):
+    def stream(self, file_id: str, chunk_size: int = settings.DOWNLOAD_CHUNK_SIZE):
         """
         Stream file content in chunks.
 
         Args:
             file_id: Unique identifier for the file
-            chunk_size: Size of each chunk to yield (default 1MB)
+            chunk_size: Size of each chunk to yield (default DOWNLOAD_CHUNK_SIZE, 8MB)
 
         Yields:
             Chunks of file content as bytes
@@ -109,9 +241,11 @@ class LocalFileStorage(FileStorageProvider):
         """
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
-        logger.info(f"LocalFileStorage initialized with base_path: {self.base_path.absolute()}")
+        # Plain string prefix for building file paths (no Path object per call)
+        self._base_prefix = str(self.base_path) + os.sep
+        logger.info("LocalFileStorage initialized with base_path: %s", self.base_path.absolute())
 
-    def _get_file_path(self, file_id: str) -> Path:
+    def _get_file_path(self, file_id: str) -> str:
         """
         Get full file path for given file_id/filename.
 
@@ -121,87 +255,95 @@ class LocalFileStorage(FileStorageProvider):
         """
         # If filename already has .pdf extension, use it as-is
         if file_id.endswith('.pdf'):
-            return self.base_path / file_id
+            return self._base_prefix + file_id
         # Otherwise append .pdf (for UUID-based names)
-        return self.base_path / f"{file_id}.pdf"
+        return self._base_prefix + file_id + ".pdf"
 
-    def save(self, file_id: str, content: bytes) -> str:
+    def save(self, file_id: str, stream: BinaryIO, size: int) -> str:
         """Save file to local storage"""
         try:
             file_path = self._get_file_path(file_id)
 
-            # Write file to disk
-            with open(file_path, 'wb') as f:
-                f.write(content)
+            # Copy to disk in 1MB chunks; unbuffered, so each chunk goes
+            # straight to os.write without another copy through BufferedWriter
+            with open(file_path, 'wb', buffering=0) as f:
+                shutil.copyfileobj(stream, f, UPLOAD_CHUNK_SIZE)
 
-            logger.info(f"File saved successfully: {file_id} at {file_path}")
+            logger.debug("File saved successfully: %s at %s", file_id, file_path)
 
             # Return relative path for storage in database
-            return str(file_path)
+            return file_path
 
         except Exception as e:
             logger.error(f"Error saving file {file_id}: {str(e)}")
             raise
 
-    def get(self, file_id: str) -> bytes:
+    def get(self, file_id: str, size: Optional[int] = None) -> bytes:
         """Retrieve file from local storage"""
-        try:
-            file_path = self._get_file_path(file_id)
+        file_path = self._get_file_path(file_id)
 
-            if not file_path.exists():
-                raise FileNotFoundError(f"File not found: {file_id}")
-
-            with open(file_path, 'rb') as f:
+        # No exists() pre-check: open() fails the same way, one syscall less
+        try:
+            # Unbuffered: a full read() is sized from fstat and read in one go
+            with open(file_path, 'rb', buffering=0) as f:
                 content = f.read()
-
-            logger.info(f"File retrieved successfully: {file_id}")
-            return content
-
         except FileNotFoundError:
-            raise
-        except Exception as e:
-            logger.error(f"Error retrieving file {file_id}: {str(e)}")
+            raise FileNotFoundError(f"File not found: {file_id}")
+        except Exception:
+            logger.exception("Error retrieving file %s", file_id)
             raise
 
+        logger.debug("File retrieved successfully: %s", file_id)
+        return content
+
     def delete(self, file_id: str) -> None:
         """Delete file from local storage"""
-        try:
-            file_path = self._get_file_path(file_id)
-
-            if not file_path.exists():
-                raise FileNotFoundError(f"File not found: {file_id}")
-
-            file_path.unlink()
-            logger.info(f"File deleted successfully: {file_id}")
+        file_path = self._get_file_path(file_id)
 
+        try:
+            os.unlink(file_path)
         except FileNotFoundError:
-            raise
-        except Exception as e:
-            logger.error(f"Error deleting file {file_id}: {str(e)}")
+            raise FileNotFoundError(f"File not found: {file_id}")
+        except Exception:
+            logger.exception("Error deleting file %s", file_id)
             raise
 
+        logger.debug("File deleted successfully: %s", file_id)
+
     def exists(self, file_id: str) -> bool:
         """Check if file exists in local storage"""
-        return self._get_file_path(file_id).exists()
+        return os.path.exists(self._get_file_path(file_id))
+
+    def get_local_path(self, file_id: str) -> Optional[str]:
+        """Get the path of the file in local storage"""
+        file_path = self._get_file_path(file_id)
+        if not os.path.isfile(file_path):
+            raise FileNotFoundError(f"File not found: {file_id}")
+        return file_path
 
-    def stream(self, file_id: str, chunk_size: int = 1024 * 1024):
+    def stream(self, file_id: str, chunk_size: int = settings.DOWNLOAD_CHUNK_SIZE):
         """Stream file from local storage in chunks"""
         try:
             file_path = self._get_file_path(file_id)
 
-            if not file_path.exists():
+            try:
+                f = open(file_path, 'rb', buffering=0)
+            except FileNotFoundError:
                 raise FileNotFoundError(f"File not found: {file_id}")
 
-            logger.info(f"[LocalFileStorage.stream] Streaming file: {file_id}, chunk_size: {chunk_size} bytes")
+            logger.debug("[LocalFileStorage.stream] Streaming file: %s, chunk_size: %s bytes", file_id, chunk_size)
 
-            with open(file_path, 'rb') as f:
+            with f:
+                # Tell the kernel the file is read front to back (larger readahead)
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
                 while True:
                     chunk = f.read(chunk_size)
                     if not chunk:
                         break
                     yield chunk
 
-            logger.info(f"[LocalFileStorage.stream] Streaming completed: {file_id}")
+            logger.debug("[LocalFileStorage.stream] Streaming completed: %s", file_id)
 
         except FileNotFoundError:
             raise
@@ -211,7 +353,13 @@ class LocalFileStorage(FileStorageProvider):
 
 
 class GCSStorageProvider(FileStorageProvider):
-    """Google Cloud Storage provider"""
+    """
+    Google Cloud Storage provider.
+
+    One instance (and one storage.Client) is shared by the whole process, see
+    initialize_storage_provider. The client is thread-safe for blob operations;
+    its HTTP session gets a connection pool sized for concurrent workers.
+    """
 
     def __init__(self, bucket_name: str, credentials_path: str = None, project_id: str = None):
         """
@@ -235,7 +383,7 @@ class GCSStorageProvider(FileStorageProvider):
             # Initialize GCS client with timeout configuration
             if credentials_path and os.path.exists(credentials_path):
                 # Use service account credentials from file
-                logger.info(f"[GCSStorageProvider.__init__] Using credentials from file: {credentials_path}")
+                logger.debug("[GCSStorageProvider.__init__] Using credentials from file: %s", credentials_path)
                 credentials = service_account.Credentials.from_service_account_file(
                     credentials_path
                 )
@@ -243,188 +391,254 @@ class GCSStorageProvider(FileStorageProvider):
                     credentials=credentials,
                     project=project_id or credentials.project_id
                 )
-                logger.info(f"[GCSStorageProvider.__init__] Client initialized with service account credentials")
+                logger.debug("[GCSStorageProvider.__init__] Client initialized with service account credentials")
             else:
                 # Use default application credentials (e.g., from Cloud Run environment)
-                logger.info(f"[GCSStorageProvider.__init__] Using default application credentials (ADC/IAM)")
+                logger.debug("[GCSStorageProvider.__init__] Using default application credentials (ADC/IAM)")
                 self.client = gcs_storage.Client(project=project_id)
-                logger.info(f"[GCSStorageProvider.__init__] Client initialized with default credentials")
+                logger.debug("[GCSStorageProvider.__init__] Client initialized with default credentials")
+
+            self._mount_http_adapter()
 
             self.bucket = self.client.bucket(self.bucket_name)
-            logger.info(f"[GCSStorageProvider.__init__] Bucket reference created: {self.bucket_name}")
+            logger.debug("[GCSStorageProvider.__init__] Bucket reference created: %s", self.bucket_name)
 
-            # Verify bucket exists and is accessible
-            logger.info(f"[GCSStorageProvider.__init__] Verifying bucket exists...")
-            try:
-                exists = self.bucket.exists()
-                logger.info(f"[GCSStorageProvider.__init__] Bucket exists check result: {exists}")
-                if not exists:
-                    raise ValueError(f"GCS bucket does not exist or is not accessible: {self.bucket_name}")
-            except Exception as check_error:
-                logger.error(f"[GCSStorageProvider.__init__] Error checking bucket existence: {str(check_error)}", exc_info=True)
-                raise ValueError(f"Cannot access GCS bucket '{self.bucket_name}': {str(check_error)}")
+            # Key prefixes, concatenated per call instead of re-formatting
+            self._blob_prefix = "uploads/"
+            # Bound method, saves the attribute lookups on every blob operation
+            self._blob_ctor = self.bucket.blob
+            self._gs_prefix = "gs://" + self.bucket_name + "/"
+
+            # Bucket access is verified on first use (_ensure_bucket), not here,
+            # to keep the GCS round-trip out of startup
+            self._verified = False
 
-            logger.info(f"[GCSStorageProvider.__init__] Successfully initialized with bucket: gs://{self.bucket_name} (timeout={self.timeout}s)")
+            logger.info("[GCSStorageProvider.__init__] Successfully initialized with bucket: gs://%s (timeout=%ss)", self.bucket_name, self.timeout)
 
         except Exception as e:
             logger.error(f"[GCSStorageProvider.__init__] Initialization failed: {str(e)}", exc_info=True)
             raise
 
+    def _mount_http_adapter(self) -> None:
+        """
+        Give the client's HTTP session a larger connection pool.
+
+        All worker threads share this client; with urllib3's default pool of 10
+        connections, concurrent requests beyond that open throwaway connections
+        (new TLS handshake each) and log "Connection pool is full". Only
+        connection errors are retried here: HTTP status retries (429/5xx) are
+        already handled by the storage library's own retry policy.
+        """
+        adapter = HTTPAdapter(
+            pool_connections=GCS_HTTP_POOL_SIZE,
+            pool_maxsize=GCS_HTTP_POOL_SIZE,
+            max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.5)
+        )
+        self.client._http.mount("https://", adapter)
+        logger.debug("[GCSStorageProvider.__init__] HTTP connection pool size: %s", GCS_HTTP_POOL_SIZE)
+
+    def _ensure_bucket(self) -> None:
+        """
+        Verify once that the bucket exists and is accessible.
+
+        Called before blob operations; after the first success it is a flag
+        check. Concurrent first calls may both verify, which is harmless.
+        """
+        if self._verified:
+            return
+
+        logger.info("[GCSStorageProvider] Verifying bucket exists: %s", self.bucket_name)
+        try:
+            exists = self.bucket.exists()
+        except Exception as check_error:
+            logger.error(f"[GCSStorageProvider] Error checking bucket existence: {str(check_error)}", exc_info=True)
+            raise ValueError(f"Cannot access GCS bucket '{self.bucket_name}': {str(check_error)}")
+        if not exists:
+            raise ValueError(f"GCS bucket does not exist or is not accessible: {self.bucket_name}")
+        self._verified = True
+
     def _get_blob_name(self, file_id: str) -> str:
         """Get GCS blob name for given file_id"""
-        return f"uploads/{file_id}.pdf"
+        return self._blob_prefix + file_id + ".pdf"
 
-    def save(self, file_id: str, content: bytes) -> str:
-        """Save file to GCS with verification"""
-        max_retries = 3
-        retry_delay = 1
+    def save(self, file_id: str, stream: BinaryIO, size: int) -> str:
+        """
+        Save file to GCS, checking the stored size from the upload response.
+
+        Transient failures (429, 5xx, connection errors) are retried with
+        exponential backoff and jitter; other errors fail immediately. This
+        blocks while waiting, so call it from a worker thread, not the event loop.
+        """
+        max_retries = GCS_UPLOAD_MAX_ATTEMPTS
 
         try:
+            self._ensure_bucket()
             blob_name = self._get_blob_name(file_id)
-            blob = self.bucket.blob(blob_name)
+            blob = self._blob_ctor(blob_name)
+            # Small files go up in one request; larger ones in size-scaled resumable chunks
+            blob.chunk_size = _pick_gcs_chunk_size(size)
+            start_position = stream.tell()
 
             # Upload file to GCS with retry logic
             for attempt in range(max_retries):
                 try:
-                    logger.info(f"[GCSStorageProvider.save] Uploading file - file_id: {file_id}, blob_name: {blob_name}, size: {len(content)} bytes (attempt {attempt + 1}/{max_retries})")
-
-                    blob.upload_from_string(
-                        content,
-                        content_type='application/pdf',
+                    logger.debug("[GCSStorageProvider.save] Uploading file - file_id: %s, blob_name: %s, size: %s bytes (attempt %s/%s)", file_id, blob_name, size, attempt + 1, max_retries)
+
+                    # Each attempt re-reads the stream from where the content starts
+                    stream.seek(start_position)
+                    blob.upload_from_file(
+                        stream,
+                        size=size,
+                        content_type=_PDF_CT,
+                        rewind=False,
                         timeout=self.timeout
                     )
-                    logger.info(f"[GCSStorageProvider.save] Upload completed, verifying file exists...")
-
-                    # VERIFICATION: Check if file actually exists in GCS
-                    if not blob.exists():
-                        raise Exception(f"File upload verification failed: file does not exist in GCS after upload")
-
-                    # Verify file size matches
-                    blob.reload()  # Refresh blob metadata from GCS
-                    if blob.size and blob.size != len(content):
-                        logger.warning(f"[GCSStorageProvider.save] Size mismatch: expected {len(content)}, got {blob.size}")
+                    # The upload response carries the stored object's metadata
+                    # (blob properties are set from it), so no exists()/reload()
+                    # round-trips are needed to verify it
+                    if blob.size and blob.size != size:
+                        logger.warning(f"[GCSStorageProvider.save] Size mismatch: expected {size}, got {blob.size}")
 
-                    logger.info(f"[GCSStorageProvider.save] ✅ File verified successfully - size: {blob.size} bytes")
-                    logger.info(f"File saved successfully to GCS: {file_id} at gs://{self.bucket_name}/{blob_name}")
+                    logger.debug("[GCSStorageProvider.save] ✅ Upload confirmed - size: %s bytes", blob.size)
+                    logger.debug("File saved successfully to GCS: %s at gs://%s/%s", file_id, self.bucket_name, blob_name)
 
                     # Return GCS path for storage in database
-                    return f"gs://{self.bucket_name}/{blob_name}"
+                    return self._gs_prefix + blob_name
 
-                except Exception as attempt_error:
+                except _TRANSIENT_GCS_ERRORS as attempt_error:
                     if attempt < max_retries - 1:
-                        import time
-                        logger.warning(f"[GCSStorageProvider.save] Upload/verification failed (attempt {attempt + 1}/{max_retries}): {str(attempt_error)}, retrying in {retry_delay}s...")
+                        retry_delay = _retry_delay(attempt)
+                        logger.warning(f"[GCSStorageProvider.save] Upload failed (attempt {attempt + 1}/{max_retries}): {str(attempt_error)}, retrying in {retry_delay:.2f}s...")
                         time.sleep(retry_delay)
                     else:
-                        raise attempt_error
+                        raise
 
         except Exception as e:
             logger.error(f"[GCSStorageProvider.save] ❌ Error saving file to GCS {file_id}: {str(e)}", exc_info=True)
             raise
 
-    def get(self, file_id: str) -> bytes:
-        """Retrieve file from GCS"""
-        try:
-            blob_name = self._get_blob_name(file_id)
-            logger.info(f"[GCSStorageProvider.get] file_id: {file_id}, blob_name: {blob_name}, bucket: {self.bucket_name}")
-
-            blob = self.bucket.blob(blob_name)
-            logger.info(f"[GCSStorageProvider.get] Created blob reference: gs://{self.bucket_name}/{blob_name}")
+    def get(self, file_id: str, size: Optional[int] = None) -> bytes:
+        """
+        Retrieve file from GCS.
 
-            exists = blob.exists()
-            logger.info(f"[GCSStorageProvider.get] Blob exists check result: {exists}")
+        When the size is known and large, the object is fetched as parallel
+        ranged GETs over the pooled connections instead of one sequential GET.
+        """
+        self._ensure_bucket()
+        blob_name = self._get_blob_name(file_id)
+        blob = self._blob_ctor(blob_name)
+        logger.debug("[GCSStorageProvider.get] file_id: %s, blob_name: %s, bucket: %s", file_id, blob_name, self.bucket_name)
+
+        # No exists() pre-check: a missing blob fails the download with
+        # NotFound, saving a round-trip on every successful read. Objects are
+        # stored without Content-Encoding, so downloads skip decoding (raw)
+        try:
+            if size is not None and size >= GCS_PARALLEL_DOWNLOAD_THRESHOLD:
+                content = self._download_ranges(blob_name, size)
+            else:
+                content = blob.download_as_bytes(raw_download=True)
+        except NotFound:
+            logger.error("[GCSStorageProvider.get] File not found in GCS - file_id: %s, blob_path: gs://%s/%s", file_id, self.bucket_name, blob_name)
+            raise FileNotFoundError(f"File not found in GCS: {file_id} (path: gs://{self.bucket_name}/{blob_name})")
+        except Exception:
+            logger.exception("[GCSStorageProvider.get] Error retrieving file - file_id: %s", file_id)
+            raise
 
-            if not exists:
-                logger.error(f"[GCSStorageProvider.get] File not found in GCS - file_id: {file_id}, blob_path: gs://{self.bucket_name}/{blob_name}")
-                raise FileNotFoundError(f"File not found in GCS: {file_id} (path: gs://{self.bucket_name}/{blob_name})")
+        logger.debug("[GCSStorageProvider.get] File retrieved successfully - file_id: %s, size: %s bytes", file_id, len(content))
+        return content
 
-            # Download file content
-            logger.info(f"[GCSStorageProvider.get] Downloading content from blob...")
-            content = blob.download_as_bytes()
+    def _download_ranges(self, blob_name: str, size: int) -> bytes:
+        """
+        Download a blob as concurrent GCS_DOWNLOAD_RANGE_SIZE ranged GETs.
 
-            logger.info(f"[GCSStorageProvider.get] File retrieved successfully - file_id: {file_id}, size: {len(content)} bytes")
-            return content
+        size is the recorded file size and may be stale: the last range is
+        open-ended, so a larger object is still read in full, and ranges past
+        the end of a smaller object (416) come back empty.
+        """
+        starts = range(0, size, GCS_DOWNLOAD_RANGE_SIZE)
+        last_start = starts[-1]
+
+        def fetch(start: int) -> bytes:
+            # Blob objects aren't thread-safe (downloads update their
+            # metadata), so each range gets its own
+            blob = self._blob_ctor(blob_name)
+            end = None if start == last_start else start + GCS_DOWNLOAD_RANGE_SIZE - 1
+            try:
+                return blob.download_as_bytes(start=start, end=end, raw_download=True, timeout=self.timeout)
+            except RequestRangeNotSatisfiable:
+                return b""
 
-        except FileNotFoundError:
-            raise
-        except Exception as e:
-            logger.error(f"[GCSStorageProvider.get] Error retrieving file - file_id: {file_id}, error: {str(e)}", exc_info=True)
-            raise
+        return b"".join(_download_executor.map(fetch, starts))
 
     def delete(self, file_id: str) -> None:
         """Delete file from GCS"""
-        try:
-            blob_name = self._get_blob_name(file_id)
-            blob = self.bucket.blob(blob_name)
-
-            if not blob.exists():
-                raise FileNotFoundError(f"File not found in GCS: {file_id}")
+        self._ensure_bucket()
+        blob = self._blob_ctor(self._get_blob_name(file_id))
 
+        try:
             blob.delete()
-            logger.info(f"File deleted successfully from GCS: {file_id}")
-
-        except FileNotFoundError:
-            raise
-        except Exception as e:
-            logger.error(f"Error deleting file from GCS {file_id}: {str(e)}")
+        except NotFound:
+            raise FileNotFoundError(f"File not found in GCS: {file_id}")
+        except Exception:
+            logger.exception("Error deleting file from GCS %s", file_id)
             raise
 
+        logger.debug("File deleted successfully from GCS: %s", file_id)
+
     def exists(self, file_id: str) -> bool:
         """Check if file exists in GCS"""
         try:
+            self._ensure_bucket()
             blob_name = self._get_blob_name(file_id)
-            blob = self.bucket.blob(blob_name)
+            blob = self._blob_ctor(blob_name)
             return blob.exists()
         except Exception as e:
             logger.error(f"Error checking file existence in GCS {file_id}: {str(e)}")
             return False
 
-    def stream(self, file_id: str, chunk_size: int = 10 * 1024 * 1024):
+    def stream(self, file_id: str, chunk_size: int = settings.DOWNLOAD_CHUNK_SIZE):
         """
         Stream file from GCS in chunks - OPTIMIZED FOR SPEED.
 
-        Uses larger chunks (10MB default) for faster throughput.
-        Downloads full blob and streams in chunks (GCS doesn't support efficient range requests).
+        Uses large chunks (DOWNLOAD_CHUNK_SIZE, 8MB default) for faster throughput.
+        Each chunk is fetched with a ranged GET (blob.open reader) just before
+        it is yielded, so the first bytes go out without waiting for the whole
+        file and memory stays at about one chunk.
         Includes retry logic and extended timeout for large files.
         """
         try:
+            self._ensure_bucket()
             blob_name = self._get_blob_name(file_id)
-            blob = self.bucket.blob(blob_name)
+            blob = self._blob_ctor(blob_name)
 
-            # Download full file from GCS with timeout handling
-            # GCS library handles all optimizations internally
-            logger.info(f"[GCSStorageProvider.stream] Starting download from GCS - file_id: {file_id}, blob: {blob_name}")
+            logger.debug("[GCSStorageProvider.stream] Starting download from GCS - file_id: %s, blob: %s", file_id, blob_name)
 
             # Use extended timeout for large files (600 seconds = 10 minutes)
             # This prevents timeout errors on large files or slow connections
             download_timeout = 600  # 10-minute timeout (was 120 seconds)
 
-            try:
-                full_content = blob.download_as_bytes(timeout=download_timeout)
-            except Exception as gcs_error:
-                logger.error(f"[GCSStorageProvider.stream] GCS download failed (timeout: {download_timeout}s) - file_id: {file_id}, error: {str(gcs_error)}", exc_info=True)
-                raise
-
-            if not full_content:
-                raise FileNotFoundError(f"File is empty in GCS: {file_id}")
-
-            logger.info(f"[GCSStorageProvider.stream] Downloaded {len(full_content)} bytes from GCS in {len(full_content) / (1024*1024):.2f}MB")
-
-            # Stream in chunks for memory efficiency
-            offset = 0
-            total_size = len(full_content)
-
-            while offset < total_size:
-                chunk_end = min(offset + chunk_size, total_size)
-                chunk = full_content[offset:chunk_end]
+            total_size = 0
+            # raw_download: objects are stored without Content-Encoding (see
+            # save), so skip the decoding layer on the response
+            with blob.open("rb", chunk_size=chunk_size, raw_download=True, timeout=download_timeout) as reader:
+                while True:
+                    try:
+                        chunk = reader.read(chunk_size)
+                    except NotFound:
+                        raise FileNotFoundError(f"File not found in GCS: {file_id}")
+                    except Exception as gcs_error:
+                        logger.error(f"[GCSStorageProvider.stream] GCS download failed (timeout: {download_timeout}s) - file_id: {file_id}, error: {str(gcs_error)}", exc_info=True)
+                        raise
 
-                if not chunk:
-                    raise RuntimeError(f"Failed to read chunk at offset {offset}")
+                    if not chunk:
+                        break
+                    total_size += len(chunk)
+                    yield chunk
 
-                yield chunk
-                offset = chunk_end
+            if not total_size:
+                raise FileNotFoundError(f"File is empty in GCS: {file_id}")
 
-            logger.info(f"[GCSStorageProvider.stream] Completed streaming file {file_id}")
+            logger.debug("[GCSStorageProvider.stream] Completed streaming file %s (%.2fMB)", file_id, total_size / (1024*1024))
 
         except FileNotFoundError:
             raise
@@ -449,7 +663,13 @@ class FileService:
             storage: Storage provider instance (defaults to global storage_provider)
         """
         self.db = db
+        # Objects stay loaded after commit (server defaults come back via
+        # RETURNING, see Document eager_defaults), so no per-row reload is needed
+        self.db.expire_on_commit = False
         self.storage = storage or storage_provider
+        # Bound once; the read paths call these per request
+        self._storage_get = self.storage.get
+        self._storage_stream = self.storage.stream
         self.logger = get_logger(__name__)
 
     def create_file(
@@ -457,53 +677,279 @@ class FileService:
         user_id: str,
         filename: str,
         original_filename: str,
-        content: bytes,
+        stream: BinaryIO,
+        size: int,
         mime_type: str = "application/pdf"
     ) -> Document:
         """
         Create and save a new file.
 
+        If the user already uploaded a file with the same content (same
+        SHA-256), the stored file is reused and nothing is uploaded; the new
+        document only gets its own database record.
+
+        Otherwise the document row is reserved first (status UPLOADING), the
+        file is uploaded, and the row is marked UPLOADED. If the upload or the
+        final update fails, the row stays UPLOADING and sweep_stale_uploads
+        removes it together with any stored data later, so the request path
+        makes no cleanup calls to storage.
+
         Args:
             user_id: UUID of the user uploading the file
             filename: System filename (usually UUID)
             original_filename: Original filename from user
-            content: File content as bytes
+            stream: Readable binary file object with the file content
+            size: File size in bytes
             mime_type: MIME type of the file
 
         Returns:
             Created Document instance
         """
         try:
-            # Save file to storage
-            file_path = self.storage.save(filename, content)
+            sha256 = _sha256_of(stream)
+            duplicate = self.db.execute(
+                select(Document.filename, Document.file_path)
+                .where(
+                    Document.user_id == user_id,
+                    Document.sha256 == sha256,
+                    Document.status != DocumentStatus.UPLOADING
+                )
+                .limit(1)
+            ).first()
+
+            if duplicate is not None:
+                # Same content already stored: point at the existing file
+                self.logger.debug("Reusing stored file %s for duplicate upload by user %s", duplicate.filename, user_id)
+                document = Document(
+                    user_id=user_id,
+                    filename=duplicate.filename,
+                    original_filename=original_filename,
+                    file_path=duplicate.file_path,
+                    file_size=size,
+                    mime_type=mime_type,
+                    sha256=sha256,
+                    status=DocumentStatus.UPLOADED
+                )
+                # INSERT ... RETURNING fills uploaded_at; no refresh needed
+                self.db.add(document)
+                self.db.commit()
+            else:
+                document = self.reserve_upload(user_id, filename, original_filename, size, mime_type, sha256)
+                self.complete_upload(document, stream, size)
+
+            self.logger.info("File created: %s for user %s", document.filename, user_id)
+            return document
+
+        except Exception as e:
+            self.db.rollback()
+            self.logger.error(f"Error creating file: {str(e)}")
+            raise
+
+    def reserve_upload(
+        self,
+        user_id: str,
+        filename: str,
+        original_filename: str,
+        size: int,
+        mime_type: str,
+        sha256: Optional[str] = None
+    ) -> Document:
+        """
+        Insert the document row of an upload before its content is stored.
+
+        The row has status UPLOADING and no file_path yet; complete_upload
+        fills both in once the file is in storage.
+
+        Returns:
+            Reserved Document instance
+        """
+        document = Document(
+            user_id=user_id,
+            filename=filename,
+            original_filename=original_filename,
+            file_path="",
+            file_size=size,
+            mime_type=mime_type,
+            sha256=sha256,
+            status=DocumentStatus.UPLOADING
+        )
+        self.db.add(document)
+        self.db.commit()
+        return document
 
-            # Create document record
-            document = Document(
+    def complete_upload(self, document: Document, stream: BinaryIO, size: int) -> Document:
+        """
+        Store the content of a reserved document and mark it UPLOADED.
+
+        On failure the row is left UPLOADING for sweep_stale_uploads.
+
+        Returns:
+            Updated Document instance
+        """
+        document.file_path = self.storage.save(document.filename, stream, size)
+        document.status = DocumentStatus.UPLOADED
+        self.db.commit()
+        return document
+
+    def sweep_stale_uploads(self, older_than_minutes: int = STALE_UPLOAD_MINUTES) -> int:
+        """
+        Remove uploads that never completed.
+
+        Deletes documents still UPLOADING after older_than_minutes, and any
+        data already written to storage for them. The rows are deleted first
+        (DELETE ... RETURNING), so only objects of rows that were really
+        removed are touched: an upload completing meanwhile keeps its file.
+
+        Returns:
+            Number of documents removed
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(minutes=older_than_minutes)
+        try:
+            stale = self.db.execute(
+                delete(Document)
+                .where(Document.status == DocumentStatus.UPLOADING, Document.uploaded_at < cutoff)
+                .returning(Document.id, Document.filename)
+                .execution_options(synchronize_session=False)
+            ).all()
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        if not stale:
+            return 0
+
+        for row in stale:
+            try:
+                self.storage.delete(row.filename)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                self.logger.warning("Could not delete stored data of stale upload %s: %s", row.id, e)
+
+        self.logger.info("Swept %s stale uploads", len(stale))
+        return len(stale)
+
+    def create_file_from_bytes(
+        self,
+        user_id: str,
+        filename: str,
+        original_filename: str,
+        content: bytes,
+        mime_type: str = "application/pdf"
+    ) -> Document:
+        """
+        Create and save a new file from in-memory content.
+
+        Compatibility wrapper for callers that already hold the bytes; uploads
+        should pass their file object to create_file instead.
+        """
+        return self.create_file(
+            user_id=user_id,
+            filename=filename,
+            original_filename=original_filename,
+            stream=io.BytesIO(content),
+            size=len(content),
+            mime_type=mime_type
+        )
+
+    async def create_files_bulk(
+        self,
+        user_id: str,
+        files: List[Tuple[str, str, BinaryIO, int, str]]
+    ) -> List[Document]:
+        """
+        Create and save several files at once.
+
+        Uploads run concurrently on a shared thread pool, then all document
+        rows are inserted with one bulk INSERT and a single commit. IDs and
+        upload times are generated here, so no refresh is needed afterwards.
+        If any upload or the commit fails, the files already written to
+        storage are removed again.
+
+        Unlike create_file, this path does not reserve UPLOADING rows: no row
+        exists until every file is stored, and the cleanup above runs in the
+        request itself, so there is nothing for sweep_stale_uploads to find.
+        Each file's SHA-256 is still recorded (no duplicate reuse here), so
+        later single uploads of the same content can reuse these files.
+
+        Args:
+            user_id: UUID of the user uploading the files
+            files: (filename, original_filename, stream, size, mime_type) tuples
+
+        Returns:
+            Created Document instances, in the same order as files
+        """
+        def hash_and_save(filename: str, stream: BinaryIO, size: int) -> Tuple[str, str]:
+            sha256 = _sha256_of(stream)
+            return self.storage.save(filename, stream, size), sha256
+
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(_upload_executor, hash_and_save, filename, stream, size)
+                for filename, _, stream, size, _ in files
+            ),
+            return_exceptions=True
+        )
+
+        saved = [f[0] for f, result in zip(files, results) if not isinstance(result, BaseException)]
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            self.logger.error("Bulk upload failed for %s/%s files: %s", len(errors), len(files), errors[0])
+            await loop.run_in_executor(_upload_executor, self._delete_stored_files, saved)
+            raise errors[0]
+
+        now = datetime.now(timezone.utc)
+        rows = [
+            dict(
+                id=uuid4(),
                 user_id=user_id,
                 filename=filename,
                 original_filename=original_filename,
                 file_path=file_path,
-                file_size=len(content),
+                file_size=size,
                 mime_type=mime_type,
-                status=DocumentStatus.UPLOADED
+                sha256=sha256,
+                status=DocumentStatus.UPLOADED,
+                uploaded_at=now
             )
+            for (filename, original_filename, _, size, mime_type), (file_path, sha256) in zip(files, results)
+        ]
 
-            self.db.add(document)
-            self.db.commit()
-            self.db.refresh(document)
+        try:
+            await asyncio.to_thread(self._insert_documents, rows)
+        except Exception as e:
+            await loop.run_in_executor(_upload_executor, self._delete_stored_files, saved)
+            self.logger.error(f"Error creating files: {str(e)}")
+            raise
 
-            self.logger.info(f"File created: {filename} for user {user_id}")
-            return document
+        # Rows were inserted without ORM state; hand back detached instances
+        documents = [Document(**row) for row in rows]
+        self.logger.info("Files created: %s for user %s", len(documents), user_id)
+        return documents
 
-        except Exception as e:
+    def _insert_documents(self, rows: List[dict]) -> None:
+        """
+        Bulk INSERT document rows and commit, rolling back on failure.
+
+        Blocking; create_files_bulk runs it in one worker thread so the Session
+        is never used from the event loop and a worker at the same time.
+        """
+        try:
+            self.db.bulk_insert_mappings(Document, rows)
+            self.db.commit()
+        except Exception:
             self.db.rollback()
-            # Try to clean up the file if DB operation failed
+            raise
+
+    def _delete_stored_files(self, filenames: List[str]) -> None:
+        """Best-effort removal of uploaded files (cleanup after a failed create)."""
+        for filename in filenames:
             try:
                 self.storage.delete(filename)
             except Exception:
                 pass
-            self.logger.error(f"Error creating file: {str(e)}")
-            raise
 
     def get_file(self, file_id: str) -> Document:
         """
@@ -515,11 +961,46 @@ class FileService:
         Returns:
             Document instance
         """
-        document = self.db.query(Document).filter(Document.id == file_id).first()
+        try:
+            document_id = file_id if isinstance(file_id, UUID) else UUID(str(file_id))
+        except ValueError:
+            raise FileNotFoundError(f"Document not found: {file_id}")
+
+        # Session.get checks the identity map first: repeated lookups of the
+        # same document within a request don't query again
+        document = self.db.get(Document, document_id)
         if not document:
             raise FileNotFoundError(f"Document not found: {file_id}")
         return document
 
+    def _get_file_reference(self, file_id: str) -> Tuple[str, Optional[int]]:
+        """
+        Get the storage reference and size of a document's file.
+
+        For LOCAL storage: original_filename; for GCS: UUID filename. Served
+        from file_cache when possible, so hot files are read without a
+        document query.
+
+        Returns:
+            Tuple of (file reference, file size in bytes)
+        """
+        key = str(file_id)
+        cached = file_cache.get_reference(key)
+        if cached is None:
+            document = self.get_file(file_id)
+            cached = (document.filename, document.original_filename, document.file_size)
+            file_cache.set_reference(key, *cached)
+
+        filename, original_filename, file_size = cached
+        storage_type = self.storage.__class__.__name__
+        if storage_type == "LocalFileStorage":
+            # For LOCAL storage, use original_filename from database
+            self.logger.debug("[FileService] Document reference - original_filename: %s, storage: %s", original_filename, storage_type)
+            return original_filename, file_size
+        # For GCS and other cloud storage, use UUID filename
+        self.logger.debug("[FileService] Document reference - filename (UUID): %s, storage: %s", filename, storage_type)
+        return filename, file_size
+
     def get_file_content(self, file_id: str) -> bytes:
         """
         Get file content by document ID.
@@ -527,35 +1008,32 @@ class FileService:
         For LOCAL storage: uses original_filename to locate file
         For GCS storage: uses UUID filename (document.filename)
 
+        Recently read files are served from the in-process file_cache.
+
         Args:
             file_id: UUID of the document
 
         Returns:
             File content as bytes
         """
-        self.logger.info(f"[FileService.get_file_content] Starting - file_id: {file_id}")
-        document = self.get_file(file_id)
+        self.logger.debug("[FileService.get_file_content] Starting - file_id: %s", file_id)
+        file_reference, file_size = self._get_file_reference(file_id)
 
-        # Determine which filename to use based on storage type
-        storage_type = self.storage.__class__.__name__
-        if storage_type == "LocalFileStorage":
-            # For LOCAL storage, use original_filename from database
-            file_reference = document.original_filename
-            self.logger.info(f"[FileService.get_file_content] Document found - original_filename: {file_reference}, storage: {storage_type}")
-        else:
-            # For GCS and other cloud storage, use UUID filename
-            file_reference = document.filename
-            self.logger.info(f"[FileService.get_file_content] Document found - filename (UUID): {file_reference}, storage: {storage_type}")
+        content = file_cache.get_content(file_reference)
+        if content is not None:
+            self.logger.debug("[FileService.get_file_content] Served from cache - size: %s bytes", len(content))
+            return content
 
         try:
-            content = self.storage.get(file_reference)
-            self.logger.info(f"[FileService.get_file_content] Successfully retrieved content - size: {len(content)} bytes")
+            content = self._storage_get(file_reference, size=file_size)
+            self.logger.debug("[FileService.get_file_content] Successfully retrieved content - size: %s bytes", len(content))
+            file_cache.set_content(file_reference, content)
             return content
         except Exception as e:
             self.logger.error(f"[FileService.get_file_content] Failed to retrieve file - file_id: {file_id}, error: {str(e)}", exc_info=True)
             raise
 
-    def stream_file_content(self, file_id: str, chunk_size: int = 1024 * 1024):
+    def stream_file_content(self, file_id: str, chunk_size: int = settings.DOWNLOAD_CHUNK_SIZE):
         """
         Stream file content by document ID in chunks (memory efficient).
 
@@ -567,69 +1045,121 @@ class FileService:
 
         Args:
             file_id: UUID of the document
-            chunk_size: Size of each chunk to stream (default 1MB)
+            chunk_size: Size of each chunk to stream (default DOWNLOAD_CHUNK_SIZE, 8MB)
 
-        Yields:
-            Chunks of file content as bytes
+        Returns:
+            The storage provider's generator of content chunks (bytes); no
+            wrapper generator in between
+
+        Raises:
+            FileNotFoundError: If the document doesn't exist
         """
-        self.logger.info(f"[FileService.stream_file_content] Starting - file_id: {file_id}, chunk_size: {chunk_size}")
-        document = self.get_file(file_id)
+        self.logger.debug("[FileService.stream_file_content] Starting - file_id: %s, chunk_size: %s", file_id, chunk_size)
+        file_reference, _ = self._get_file_reference(file_id)
+        return self._storage_stream(file_reference, chunk_size=chunk_size)
 
-        # Determine which filename to use based on storage type
-        storage_type = self.storage.__class__.__name__
-        if storage_type == "LocalFileStorage":
-            # For LOCAL storage, use original_filename from database
-            file_reference = document.original_filename
-            self.logger.info(f"[FileService.stream_file_content] Document found - original_filename: {file_reference}, storage: {storage_type}")
-        else:
-            # For GCS and other cloud storage, use UUID filename
-            file_reference = document.filename
-            self.logger.info(f"[FileService.stream_file_content] Document found - filename (UUID): {file_reference}, storage: {storage_type}")
+    def get_local_file_path(self, document: Document) -> Optional[str]:
+        """
+        Get the local filesystem path of a document's file, if storage is local.
 
-        try:
-            # Stream from storage provider
-            for chunk in self.storage.stream(file_reference, chunk_size=chunk_size):
-                yield chunk
-            self.logger.info(f"[FileService.stream_file_content] Successfully streamed file - file_id: {file_id}")
-        except Exception as e:
-            self.logger.error(f"[FileService.stream_file_content] Failed to stream file - file_id: {file_id}, error: {str(e)}", exc_info=True)
-            raise
+        Uses the same file reference as get_file_content / stream_file_content
+        (original_filename for LOCAL storage).
+
+        Args:
+            document: Document instance
+
+        Returns:
+            File path, or None if the storage provider has no local files
+        """
+        if self.storage.__class__.__name__ == "LocalFileStorage":
+            return self.storage.get_local_path(document.original_filename)
+        return self.storage.get_local_path(document.filename)
 
     def list_files(
         self,
         user_id: str,
         skip: int = 0,
         limit: int = 10,
-        status: DocumentStatus = None
-    ) -> tuple[list[Document], int]:
+        status: DocumentStatus = None,
+        before: Optional[datetime] = None,
+        before_id: Optional[UUID] = None
+    ) -> tuple[list, int]:
         """
-        List files for a user with pagination.
+        List files for a user with pagination, newest first.
+
+        Pagination: pass the uploaded_at / id of the last document of the
+        previous page as before / before_id (keyset, served by the
+        ix_document_user_status_uploaded index). skip is still accepted but
+        gets slower the deeper the page.
+
+        The total comes from count(*) OVER () in the same query. With a
+        cursor it counts the documents from the cursor on (what is left to
+        page through), not all of the user's documents.
 
         Args:
             user_id: UUID of the user
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when before is given)
             limit: Maximum number of records to return
             status: Optional filter by document status
+            before: uploaded_at of the last document of the previous page
+            before_id: id of the last document of the previous page (tie-breaker)
 
         Returns:
-            Tuple of (documents list, total count)
+            Tuple of (document rows with the LIST_COLUMNS attributes, total count)
         """
-        query = self.db.query(Document).filter(Document.user_id == user_id)
-
+        conditions = [Document.user_id == user_id]
         if status:
-            query = query.filter(Document.status == status)
+            conditions.append(Document.status == status)
+        else:
+            # Unfinished uploads are not listed
+            conditions.append(Document.status != DocumentStatus.UPLOADING)
 
-        total = query.count()
-        documents = query.order_by(Document.uploaded_at.desc()).offset(skip).limit(limit).all()
+        if before is not None:
+            if before_id is not None:
+                conditions.append(tuple_(Document.uploaded_at, Document.id) < tuple_(before, before_id))
+            else:
+                conditions.append(Document.uploaded_at < before)
+            skip = 0
 
-        return documents, total
+        return self._fetch_page(conditions, skip, limit)
+
+    def _fetch_page(self, conditions: list, skip: int, limit: int) -> tuple[list, int]:
+        """
+        Fetch one page of documents plus the total match count in a single query.
+
+        Only LIST_COLUMNS are selected; rows are returned as-is (attribute
+        access like a Document, but no ORM instances or identity map).
+
+        The count is a window function (count(*) OVER ()), evaluated before
+        LIMIT/OFFSET, so it reflects all matching rows. Only a page past the
+        end (no rows to carry the count) needs a separate COUNT.
+        """
+        stmt = (
+            select(*LIST_COLUMNS, func.count().over().label("total"))
+            .where(*conditions)
+            .order_by(Document.uploaded_at.desc(), Document.id.desc())
+            .limit(limit)
+        )
+        if skip:
+            stmt = stmt.offset(skip)
+
+        rows = self.db.execute(stmt).all()
+        if rows:
+            return rows, rows[0].total
+
+        total = 0
+        if skip:
+            total = self.db.execute(
+                select(func.count()).select_from(Document).where(*conditions)
+            ).scalar_one()
+        return [], total
 
     def list_all_files(
         self,
         skip: int = 0,
         limit: int = 10,
         status: DocumentStatus = None
-    ) -> tuple[list[Document], int]:
+    ) -> tuple[list, int]:
         """
         List ALL files from database with pagination (no user filter).
 
@@ -639,22 +1169,26 @@ class FileService:
             status: Optional filter by document status
 
         Returns:
-            Tuple of (documents list, total count)
+            Tuple of (document rows with the LIST_COLUMNS attributes, total count)
         """
-        query = self.db.query(Document)
-
+        conditions = []
         if status:
-            query = query.filter(Document.status == status)
-
-        total = query.count()
-        documents = query.order_by(Document.uploaded_at.desc()).offset(skip).limit(limit).all()
+            conditions.append(Document.status == status)
+        else:
+            # Unfinished uploads are not listed
+            conditions.append(Document.status != DocumentStatus.UPLOADING)
 
-        return documents, total
+        return self._fetch_page(conditions, skip, limit)
 
     def delete_file(self, file_id: str, user_id: str = None) -> bool:
         """
         Delete a file (both from storage and database).
 
+        The row is deleted and committed first; the stored file is then
+        removed in the background on a small dedicated pool. A failed storage
+        delete therefore leaves an orphaned object (logged), never a document
+        whose file is gone.
+
         Args:
             file_id: UUID of the document
             user_id: Optional UUID to verify ownership
@@ -669,14 +1203,35 @@ class FileService:
             if user_id and document.user_id != user_id:
                 raise PermissionError("User does not have permission to delete this file")
 
-            # Delete from storage
-            self.storage.delete(document.filename)
+            # The stored file is kept if a duplicate upload shares it
+            shared = document.sha256 is not None and self.db.execute(
+                select(Document.id)
+                .where(
+                    Document.user_id == document.user_id,
+                    Document.sha256 == document.sha256,
+                    Document.file_path == document.file_path,
+                    Document.id != document.id
+                )
+                .limit(1)
+            ).first() is not None
 
             # Delete from database
             self.db.delete(document)
             self.db.commit()
 
-            self.logger.info(f"File deleted: {file_id}")
+            # Then delete from storage, in the background
+            if not shared:
+                storage_delete = _delete_executor.submit(self.storage.delete, document.filename)
+                storage_delete.add_done_callback(
+                    lambda future, filename=document.filename: self._log_storage_delete_error(future, filename)
+                )
+
+            # Reads key the cache by filename (GCS) or original_filename (LOCAL)
+            file_cache.invalidate_content(document.filename)
+            file_cache.invalidate_content(document.original_filename)
+            file_cache.invalidate_reference(str(document.id))
+
+            self.logger.info("File deleted: %s", file_id)
             return True
 
         except FileNotFoundError:
@@ -685,6 +1240,7 @@ class FileService:
                 document = self.get_file(file_id)
                 self.db.delete(document)
                 self.db.commit()
+                file_cache.invalidate_reference(str(document.id))
                 return True
             except FileNotFoundError:
                 return False
@@ -693,6 +1249,13 @@ class FileService:
             self.logger.error(f"Error deleting file: {str(e)}")
             raise
 
+    def _log_storage_delete_error(self, future, filename: str) -> None:
+        """Done callback of a background storage delete: report failures."""
+        error = future.exception()
+        # Already gone from storage is fine; the record is removed regardless
+        if error is not None and not isinstance(error, FileNotFoundError):
+            self.logger.error("Could not delete stored file %s of a deleted document: %s", filename, error)
+
     def update_file_status(self, file_id: str, status: DocumentStatus) -> Document:
         """
         Update file processing status.
@@ -707,14 +1270,14 @@ class FileService:
         try:
             document = self.get_file(file_id)
             document.status = status
+            file_cache.invalidate_reference(str(document.id))
 
             if status == DocumentStatus.PROCESSED:
                 document.processed_at = datetime.utcnow()
 
             self.db.commit()
-            self.db.refresh(document)
 
-            self.logger.info(f"File status updated: {file_id} -> {status}")
+            self.logger.info("File status updated: %s -> %s", file_id, status)
             return document
 
         except Exception as e:
@@ -736,51 +1299,49 @@ def initialize_storage_provider(config) -> FileStorageProvider:
     global storage_provider
 
     # Log configuration for debugging
-    logger.info("="*60)
-    logger.info("STORAGE PROVIDER INITIALIZATION")
-    logger.info("="*60)
-    logger.info(f"[CONFIG] STORAGE_TYPE: {config.STORAGE_TYPE}")
-    logger.info(f"[CONFIG] GCS_BUCKET_NAME: {config.GCS_BUCKET_NAME}")
-    logger.info(f"[CONFIG] GCS_PROJECT_ID: {config.GCS_PROJECT_ID}")
-    logger.info(f"[CONFIG] GCS_CREDENTIALS_PATH: {config.GCS_CREDENTIALS_PATH}")
+    logger.debug("="*60)
+    logger.debug("STORAGE PROVIDER INITIALIZATION")
+    logger.debug("="*60)
+    logger.debug("[CONFIG] STORAGE_TYPE: %s", config.STORAGE_TYPE)
+    logger.debug("[CONFIG] GCS_BUCKET_NAME: %s", config.GCS_BUCKET_NAME)
+    logger.debug("[CONFIG] GCS_PROJECT_ID: %s", config.GCS_PROJECT_ID)
+    logger.debug("[CONFIG] GCS_CREDENTIALS_PATH: %s", config.GCS_CREDENTIALS_PATH)
 
     storage_type = config.STORAGE_TYPE.lower()
-    logger.info(f"[DECISION] Storage type (lowercase): '{storage_type}'")
+    logger.debug("[DECISION] Storage type (lowercase): '%s'", storage_type)
 
     if storage_type == "gcs":
-        logger.info("[CHOICE] Selected: GCS Storage Provider")
-        logger.info(f"[VALIDATION] Checking GCS_BUCKET_NAME: {'PRESENT' if config.GCS_BUCKET_NAME else 'EMPTY'}")
+        logger.debug("[CHOICE] Selected: GCS Storage Provider")
+        logger.debug("[VALIDATION] Checking GCS_BUCKET_NAME: %s", 'PRESENT' if config.GCS_BUCKET_NAME else 'EMPTY')
 
         if not config.GCS_BUCKET_NAME:
             logger.error("[ERROR] GCS_BUCKET_NAME is not configured!")
             raise ValueError("GCS_BUCKET_NAME not configured")
 
-        logger.info(f"[VALIDATION] GCS_CREDENTIALS_PATH: {config.GCS_CREDENTIALS_PATH if config.GCS_CREDENTIALS_PATH else 'None (will use ADC/IAM)'}")
-        logger.info(f"[VALIDATION] GCS_PROJECT_ID: {config.GCS_PROJECT_ID if config.GCS_PROJECT_ID else 'Not set'}")
+        logger.debug("[VALIDATION] GCS_CREDENTIALS_PATH: %s", config.GCS_CREDENTIALS_PATH if config.GCS_CREDENTIALS_PATH else 'None (will use ADC/IAM)')
+        logger.debug("[VALIDATION] GCS_PROJECT_ID: %s", config.GCS_PROJECT_ID if config.GCS_PROJECT_ID else 'Not set')
 
         try:
-            logger.info("[INIT] Creating GCSStorageProvider instance...")
+            logger.debug("[INIT] Creating GCSStorageProvider instance...")
             storage_provider = GCSStorageProvider(
                 bucket_name=config.GCS_BUCKET_NAME,
                 credentials_path=config.GCS_CREDENTIALS_PATH if config.GCS_CREDENTIALS_PATH else None,
                 project_id=config.GCS_PROJECT_ID if config.GCS_PROJECT_ID else None
             )
-            logger.info("[SUCCESS] GCSStorageProvider initialized successfully")
+            logger.debug("[SUCCESS] GCSStorageProvider initialized successfully")
         except Exception as e:
-            logger.error(f"[ERROR] Failed to initialize GCSStorageProvider: {str(e)}")
+            logger.error("[ERROR] Failed to initialize GCSStorageProvider: %s", str(e))
             raise
     else:
-        logger.info(f"[CHOICE] Selected: Local File Storage Provider")
-        logger.info(f"[REASON] STORAGE_TYPE is '{storage_type}' (not 'gcs'), defaulting to local storage")
+        logger.debug("[CHOICE] Selected: Local File Storage Provider")
+        logger.debug("[REASON] STORAGE_TYPE is '%s' (not 'gcs'), defaulting to local storage", storage_type)
         try:
-            logger.info("[INIT] Creating LocalFileStorage instance...")
+            logger.debug("[INIT] Creating LocalFileStorage instance...")
             storage_provider = LocalFileStorage(base_path=config.FILE_STORAGE_PATH)
-            logger.info("[SUCCESS] LocalFileStorage initialized successfully")
+            logger.debug("[SUCCESS] LocalFileStorage initialized successfully")
         except Exception as e:
-            logger.error(f"[ERROR] Failed to initialize LocalFileStorage: {str(e)}")
+            logger.error("[ERROR] Failed to initialize LocalFileStorage: %s", str(e))
             raise
 
-    logger.info("="*60)
-    logger.info(f"✅ Storage provider initialized: {storage_provider.__class__.__name__}")
-    logger.info("="*60)
+    logger.info("✅ Storage provider initialized: %s", storage_provider.__class__.__name__)
     return storage_provider
@@ -1,6 +1,6 @@
 """RAG (Retrieval-Augmented Generation) Service Module"""
 
-from app.services.rag.rag_service import RAGService
+from app.services.rag.rag_service import RAGService, SearchChunk, SourceRef
 from app.services.rag.tools import RAGToolFactory, create_rag_tools
 
-__all__ = ["RAGService", "RAGToolFactory", "create_rag_tools"]
+__all__ = ["RAGService", "SearchChunk", "SourceRef", "RAGToolFactory", "create_rag_tools"]
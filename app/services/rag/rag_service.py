@@ -5,7 +5,7 @@ Handles vector embeddings, semantic search using pgvector,
 and retrieval of relevant document chunks for context augmentation.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TypedDict
 from sqlalchemy.orm import Session
 from sqlalchemy import text as sql_text
 from uuid import UUID
@@ -18,6 +18,26 @@ from app.core.logging import get_logger
 logger = get_logger(__name__)
 
 
+class SearchChunk(TypedDict):
+    """Internal search hit returned by semantic_search() (plain dict, no validation)."""
+    chunk_id: str
+    content: str
+    document_id: str
+    filename: str
+    page: Optional[int]
+    similarity_score: float
+    chunk_index: int
+    metadata: Dict[str, Any]
+
+
+class SourceRef(TypedDict):
+    """Internal citation entry returned by extract_sources()."""
+    document_id: str
+    filename: str
+    page: Optional[int]
+    similarity_score: float
+
+
 class RAGService:
     """Service for semantic search and RAG context retrieval."""
 
@@ -31,9 +51,8 @@ class RAGService:
         """Lazy load chat config from database."""
         if self._config is None:
             try:
-                from app.services.rag_config_service import ChatConfigService
-                config_service = ChatConfigService(self.db)
-                self._config = config_service.get_config_dict()
+                from app.services.rag_config_service import get_cached_config_dict
+                self._config = get_cached_config_dict(self.db)
             except Exception as e:
                 logger.warning(f"Failed to load chat config from database: {e}, using defaults")
                 # Fallback to hardcoded defaults
@@ -95,7 +114,7 @@ class RAGService:
         query_text: str,
         top_k: Optional[int] = None,
         similarity_threshold: Optional[float] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> List[SearchChunk]:
         """
         Perform semantic search using pgvector cosine similarity.
 
@@ -105,8 +124,8 @@ class RAGService:
             similarity_threshold: Minimum similarity score (0-1, None = use database config)
 
         Returns:
-            List of dicts with keys: content, document_id, filename, page,
-            similarity_score, chunk_index, chunk_metadata
+            List of SearchChunk dicts with keys: chunk_id, content, document_id,
+            filename, page, similarity_score, chunk_index, metadata
 
         Raises:
             RuntimeError: If search fails
@@ -154,7 +173,7 @@ class RAGService:
 
             result = self.db.execute(sql_text(query), {"limit": top_k})
 
-            results = []
+            results: List[SearchChunk] = []
             for row in result.fetchall():
                 chunk_id, content, doc_id, filename, page_num, similarity, chunk_idx, metadata = row
 
@@ -180,7 +199,7 @@ class RAGService:
             logger.error(f"Semantic search failed: {e}")
             raise RuntimeError(f"Semantic search failed: {e}")
 
-    def format_rag_context(self, chunks: List[Dict[str, Any]]) -> str:
+    def format_rag_context(self, chunks: List[SearchChunk]) -> str:
         """
         Format retrieved chunks into a context string for LLM prompt.
 
@@ -206,7 +225,7 @@ class RAGService:
 
         return context_str
 
-    def extract_sources(self, chunks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def extract_sources(self, chunks: List[SearchChunk]) -> List[SourceRef]:
         """
         Extract source metadata from retrieved chunks.
 
@@ -214,9 +233,9 @@ class RAGService:
             chunks: List of chunk dicts from semantic_search()
 
         Returns:
-            List of source dicts with: document_id, filename, page, similarity_score
+            List of SourceRef dicts with: document_id, filename, page, similarity_score
         """
-        sources = []
+        sources: List[SourceRef] = []
         seen = set()  # Track unique (doc_id, page) pairs
 
         for chunk in chunks:
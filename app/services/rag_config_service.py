@@ -5,13 +5,58 @@ Manages chat system settings from database.
 Provides CRUD operations for chat configuration (RAG parameters + prompt_general).
 """
 
+import time
 from typing import Dict, Any, Optional
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 from app.models.chat_config import ChatConfig
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Process-level cache of ChatConfig.to_dict() for the per-message read path.
+# Cleared by mapper events on ChatConfig writes; the TTL bounds staleness for
+# other worker processes.
+CONFIG_CACHE_TTL_SECONDS = 60
+
+_config_cache: Optional[Dict[str, Any]] = None
+_config_cache_expires_at: float = 0.0
+
+
+def get_cached_config_dict(db: Session) -> Dict[str, Any]:
+    """
+    Get chat configuration as dictionary, served from the process cache.
+
+    Args:
+        db: Database session (only used on cache miss)
+
+    Returns:
+        Copy of the cached configuration dict
+    """
+    global _config_cache, _config_cache_expires_at
+
+    now = time.monotonic()
+    if _config_cache is None or now >= _config_cache_expires_at:
+        _config_cache = ChatConfigService(db).get_config_dict()
+        _config_cache_expires_at = now + CONFIG_CACHE_TTL_SECONDS
+
+    return dict(_config_cache)
+
+
+def invalidate_config_cache() -> None:
+    """Drop the cached configuration (next read hits the database)."""
+    global _config_cache, _config_cache_expires_at
+    _config_cache = None
+    _config_cache_expires_at = 0.0
+
+
+@event.listens_for(ChatConfig, "after_insert")
+@event.listens_for(ChatConfig, "after_update")
+@event.listens_for(ChatConfig, "after_delete")
+def _on_config_write(mapper, connection, target) -> None:
+    """Invalidate the cache whenever the config row is written."""
+    invalidate_config_cache()
+
 
 class ChatConfigService:
     """Service for managing chat configuration."""
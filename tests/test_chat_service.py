@@ -0,0 +1,48 @@
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.services.chat.chat_service import ChatService
+
+
+@pytest.fixture(autouse=True)
+def clear_model_cache():
+    ChatService.invalidate_model_cache()
+    yield
+    ChatService.invalidate_model_cache()
+
+
+def make_service(*results):
+    """ChatService whose model query returns results from successive .first() calls."""
+    db = MagicMock()
+    db.query.return_value.filter.return_value.first.side_effect = list(results)
+    return ChatService(db, llm_service=MagicMock()), db
+
+
+def test_get_model_by_name_miss_then_hit():
+    row = MagicMock(name="row")
+    service, db = make_service(row)
+
+    assert service._get_model("gpt-4o") is row
+    assert service._get_model("gpt-4o") is row
+    # Second lookup is served from the cache
+    assert db.query.return_value.filter.return_value.first.call_count == 1
+
+
+def test_get_model_by_uuid_miss_then_hit():
+    row = MagicMock(name="row")
+    model_id = str(uuid4())
+    service, db = make_service(row)
+
+    assert service._get_model(model_id) is row
+    assert service._get_model(model_id) is row
+    assert db.query.return_value.filter.return_value.first.call_count == 1
+
+
+def test_get_model_unknown_name_is_not_cached():
+    service, db = make_service(None, None)
+
+    assert service._get_model("missing") is None
+    assert service._get_model("missing") is None
+    assert db.query.return_value.filter.return_value.first.call_count == 2